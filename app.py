@@ -1,24 +1,45 @@
-from flask import Flask, render_template, request, flash, redirect, url_for, jsonify
+from flask import Flask, render_template, request, flash, redirect, url_for, jsonify, session, make_response, g, has_request_context, send_from_directory
+from flask.signals import before_render_template, template_rendered
 from flask_sqlalchemy import SQLAlchemy
-from flask_admin import Admin
-from flask_admin.contrib.sqla import ModelView
-from flask_mail import Mail, Message
-from flask_wtf import FlaskForm
-from wtforms import StringField, TextAreaField, SubmitField
-from wtforms.validators import DataRequired, Email
+from sqlalchemy import event, inspect
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session as SQLAlchemySession, defer, load_only, selectinload
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from itertools import islice
+from pathlib import Path
+from urllib.parse import urlencode
+import csv
+import gzip
+import hashlib
+import hmac
+import io
+import json
+import mimetypes
 import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+import click
 from dotenv import load_dotenv
 
-try:
-    import requests
-    from requests.exceptions import RequestException
-except ImportError:
-    requests = None
-
-    class RequestException(Exception):
-        """Fallback exception when requests is absent."""
-        pass
+# Flask-Admin, Flask-Mail, WTForms et requests sont importés à la première utilisation
+# (voir create_admin_app, get_mail, contact_form_class, get_http_session) pour
+# alléger les démarrages à froid (Vercel, redémarrage des workers gunicorn).
 
 # Charger les variables d'environnement
 load_dotenv()
@@ -28,6 +49,44 @@ app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///cognito.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+def database_engine_options(uri):
+    """Options du moteur SQLAlchemy selon la base ciblée (variables DB_* / SQLITE_*)."""
+    if uri.startswith('sqlite'):
+        # Les PRAGMA (WAL, busy_timeout, synchronous) sont posés à la connexion, voir _configure_sqlite
+        return {"connect_args": {"timeout": int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000)) / 1000}}
+    options = {
+        "pool_size": int(os.getenv('DB_POOL_SIZE', 5)),
+        "max_overflow": int(os.getenv('DB_MAX_OVERFLOW', 5)),
+        "pool_timeout": int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        "pool_recycle": int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        "pool_pre_ping": True,
+    }
+    if uri.startswith('postgres'):
+        options["connect_args"] = {
+            "connect_timeout": int(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+            "options": f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 5000))}",
+        }
+    return options
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = database_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+
+# Cache de pages (nombre d'entrées, durée de vie côté serveur et côté navigateur/CDN en secondes)
+app.config['PAGE_CACHE_MAX_ENTRIES'] = int(os.getenv('PAGE_CACHE_MAX_ENTRIES', 128))
+app.config['PAGE_CACHE_TTL'] = int(os.getenv('PAGE_CACHE_TTL', 300))
+app.config['PAGE_CACHE_MAX_AGE'] = int(os.getenv('PAGE_CACHE_MAX_AGE', 60))
+
+# Compression des réponses (taille minimale en octets, niveaux des réponses dynamiques)
+app.config['COMPRESS_MIN_SIZE'] = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_LEVEL_GZIP'] = int(os.getenv('COMPRESS_LEVEL_GZIP', 6))
+app.config['COMPRESS_LEVEL_BR'] = int(os.getenv('COMPRESS_LEVEL_BR', 5))
+app.config['COMPRESS_LEVEL_ZSTD'] = int(os.getenv('COMPRESS_LEVEL_ZSTD', 3))
+
+# Cache de fragments Jinja ({% cache %}) et bytecode des templates partagé entre les workers
+app.config['FRAGMENT_CACHE_ENABLED'] = os.getenv('FRAGMENT_CACHE_ENABLED', 'True').lower() == 'true'
+app.config['FRAGMENT_CACHE_TTL'] = int(os.getenv('FRAGMENT_CACHE_TTL', 3600))
+# Non défini : répertoire propre à l'utilisateur (0700, propriétaire vérifié) choisi par Jinja ; vide : désactivé
+app.config['JINJA_BYTECODE_CACHE_DIR'] = os.getenv('JINJA_BYTECODE_CACHE_DIR')
+
 # Configuration Mail
 app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER')
 app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
@@ -37,12 +96,37 @@ app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
 
 # Initialisation des extensions
 db = SQLAlchemy(app)
-mail = Mail(app)
-admin = Admin(app, name='Cognito Admin', template_mode='bootstrap4')
+
+@event.listens_for(Engine, 'connect')
+def _configure_sqlite(dbapi_connection, connection_record):
+    """WAL + busy_timeout : lectures concurrentes et écritures qui attendent au lieu d'échouer."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={os.getenv('SQLITE_JOURNAL_MODE', 'WAL')}")
+    cursor.execute(f"PRAGMA busy_timeout={int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))}")
+    cursor.execute(f"PRAGMA synchronous={os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')}")
+    cursor.close()
 
 GITHUB_USERNAME = "JonathanK-N"
-GITHUB_CACHE_DURATION = timedelta(hours=3)
-GITHUB_CACHE = {"profile": None, "repos": [], "timestamp": None}
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+# Âge maximal du snapshot avant une sync en arrière-plan (0 : uniquement `flask sync-github`, ex. cron)
+GITHUB_SYNC_INTERVAL = int(os.getenv('GITHUB_SYNC_INTERVAL', 3 * 3600))
+GITHUB_SNAPSHOT_CHECK_INTERVAL = 30
+GITHUB_SNAPSHOT = {"checked": float('-inf'), "version": None}
+GITHUB_CACHE = {
+    "profile": None,
+    "repos": [],
+    "repos_by_language": {},
+    "repos_by_topic": {},
+    "timestamp": None,
+}
+
+# Rafraîchissement GitHub en arrière-plan : un seul à la fois, profil et dépôts en parallèle.
+# En mode ASGI (asgi.py), "scheduler" le lance sur la boucle d'événements plutôt que dans un thread.
+GITHUB_REFRESH_LOCK = threading.Lock()
+GITHUB_REFRESH_STATE = {"running": False, "scheduler": None}
+GITHUB_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="github")
 
 GITHUB_FALLBACK_PROFILE = {
     "name": "Jonathan Kakesa",
@@ -233,6 +317,14 @@ WORKFLOW_STEPS = [
 ]
 
 # Modèles de base de données
+project_stack = db.Table(
+    'project_stack',
+    db.Column('project_id', db.Integer, db.ForeignKey('project.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tag.id', ondelete='CASCADE'), primary_key=True),
+    # Recherche des projets d'une technologie donnée
+    db.Index('ix_project_stack_tag_id', 'tag_id', 'project_id'),
+)
+
 class Project(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -243,7 +335,74 @@ class Project(db.Model):
     detailed_description = db.Column(db.Text)
     demo_url = db.Column(db.String(200))
     features = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Clé du curseur du catalogue (created_at, id) : jamais NULL
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    # Version normalisée de `stack` et `features`, synchronisée à chaque flush.
+    # Chargement paresseux : les listes n'en ont pas besoin, selectinload() là où elles servent
+    stack_tags = db.relationship('Tag', secondary=project_stack, order_by='Tag.name')
+    feature_list = db.relationship(
+        'ProjectFeature',
+        order_by='ProjectFeature.position',
+        cascade='all, delete-orphan',
+    )
+
+    # Ordre du catalogue et pagination par curseur (created_at, id)
+    __table_args__ = (db.Index('ix_project_created_at_id', 'created_at', 'id'),)
+
+class Tag(db.Model):
+    """Technologie de la stack d'un projet (Flask, PostgreSQL, ...)."""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    slug = db.Column(db.String(100), nullable=False, unique=True, index=True)
+
+class ProjectFeature(db.Model):
+    """Point clé d'un projet, dans l'ordre de saisie."""
+    id = db.Column(db.Integer, primary_key=True)
+    project_id = db.Column(
+        db.Integer, db.ForeignKey('project.id', ondelete='CASCADE'), nullable=False, index=True
+    )
+    position = db.Column(db.Integer, nullable=False, default=0)
+    label = db.Column(db.String(300), nullable=False)
+
+def split_list(value):
+    """Découpe une liste saisie séparée par des virgules."""
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+def tag_slug(name):
+    return name.strip().lower()
+
+def sync_project_tags(session, project):
+    """Reconstruit stack_tags et feature_list à partir des champs texte du projet."""
+    tags = session.info.setdefault('tag_cache', {})
+    stack_tags = []
+    with session.no_autoflush:
+        for name in split_list(project.stack):
+            slug = tag_slug(name)
+            tag = tags.get(slug) or Tag.query.filter_by(slug=slug).first()
+            if tag is None:
+                tag = Tag(name=name, slug=slug)
+                session.add(tag)
+            tags[slug] = tag
+            if tag not in stack_tags:
+                stack_tags.append(tag)
+    project.stack_tags = stack_tags
+    project.feature_list = [
+        ProjectFeature(position=position, label=label[:300])
+        for position, label in enumerate(split_list(project.features))
+    ]
+
+@event.listens_for(SQLAlchemySession, 'before_flush')
+def _sync_project_tags_before_flush(session, flush_context, instances):
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Project):
+            continue
+        state = inspect(obj)
+        if obj in session.new or any(
+            state.attrs[name].history.has_changes() for name in ('stack', 'features')
+        ):
+            sync_project_tags(session, obj)
+    session.info.pop('tag_cache', None)
 
 class Testimonial(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -253,6 +412,8 @@ class Testimonial(db.Model):
     rating = db.Column(db.Integer, default=5)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (db.Index('ix_testimonial_rating_created_at', 'rating', 'created_at'),)
+
 class Contact(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -260,96 +421,1643 @@ class Contact(db.Model):
     message = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (db.Index('ix_contact_created_at_id', 'created_at', 'id'),)
+
+class OutboxMessage(db.Model):
+    """Email en attente d'envoi par le worker de la file (voir process_outbox)."""
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(200), nullable=False)
+    sender = db.Column(db.String(120))
+    recipients = db.Column(db.String(500), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    locked_until = db.Column(db.DateTime)
+    sent_at = db.Column(db.DateTime, index=True)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Snapshot GitHub alimenté par sync_github() : les routes ne lisent que ces tables
+class GitHubProfile(db.Model):
+    """Profil GitHub synchronisé ; synced_at / changed_at servent aussi de bail et de version du snapshot."""
+    __tablename__ = 'github_profile'
+    login = db.Column(db.String(100), primary_key=True)
+    name = db.Column(db.String(200))
+    followers = db.Column(db.Integer)
+    public_repos = db.Column(db.Integer)
+    public_gists = db.Column(db.Integer)
+    html_url = db.Column(db.String(300))
+    blog = db.Column(db.String(300))
+    company = db.Column(db.String(200))
+    bio = db.Column(db.Text)
+    synced_at = db.Column(db.DateTime)
+    changed_at = db.Column(db.DateTime)
+
+    def as_dict(self):
+        return {
+            "name": self.name or self.login,
+            "login": self.login,
+            "followers": self.followers or 0,
+            "public_repos": self.public_repos or 0,
+            "public_gists": self.public_gists or 0,
+            "html_url": self.html_url,
+            "blog": self.blog,
+            "company": self.company,
+            "bio": self.bio,
+        }
+
+class GitHubRepo(db.Model):
+    __tablename__ = 'github_repo'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False, unique=True)
+    description = db.Column(db.Text)
+    html_url = db.Column(db.String(300))
+    language = db.Column(db.String(50))
+    stargazers_count = db.Column(db.Integer, nullable=False, default=0)
+    forks_count = db.Column(db.Integer, nullable=False, default=0)
+    # Horodatage ISO 8601 tel que renvoyé par l'API (trié comme une date)
+    pushed_at = db.Column(db.String(20))
+
+    topics = db.relationship(
+        'GitHubRepoTopic',
+        order_by='GitHubRepoTopic.topic',
+        cascade='all, delete-orphan',
+        lazy='selectin',
+    )
+    languages = db.relationship(
+        'GitHubRepoLanguage',
+        order_by='GitHubRepoLanguage.bytes.desc()',
+        cascade='all, delete-orphan',
+        lazy='selectin',
+    )
+
+    # Ordre d'affichage des dépôts (étoiles, forks, activité)
+    __table_args__ = (db.Index('ix_github_repo_rank', 'stargazers_count', 'forks_count', 'pushed_at'),)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "description": self.description,
+            "html_url": self.html_url,
+            "language": self.language,
+            "languages": [entry.language for entry in self.languages],
+            "topics": [entry.topic for entry in self.topics],
+            "stargazers_count": self.stargazers_count,
+            "forks_count": self.forks_count,
+            "pushed_at": self.pushed_at,
+        }
+
+class GitHubRepoTopic(db.Model):
+    __tablename__ = 'github_repo_topic'
+    repo_id = db.Column(db.Integer, db.ForeignKey('github_repo.id', ondelete='CASCADE'), primary_key=True)
+    topic = db.Column(db.String(50), primary_key=True)
+
+    __table_args__ = (db.Index('ix_github_repo_topic_topic', 'topic', 'repo_id'),)
+
+class GitHubRepoLanguage(db.Model):
+    """Répartition des langages d'un dépôt (octets de code), d'après /repos/<dépôt>/languages."""
+    __tablename__ = 'github_repo_language'
+    repo_id = db.Column(db.Integer, db.ForeignKey('github_repo.id', ondelete='CASCADE'), primary_key=True)
+    language = db.Column(db.String(50), primary_key=True)
+    bytes = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.Index('ix_github_repo_language_language', 'language', 'repo_id'),)
+
+class GitHubSyncState(db.Model):
+    """Dernière réponse de l'API par chemin : validateurs pour les requêtes conditionnelles et données normalisées."""
+    __tablename__ = 'github_sync_state'
+    path = db.Column(db.String(300), primary_key=True)
+    etag = db.Column(db.String(200))
+    last_modified = db.Column(db.String(100))
+    data = db.Column(db.Text, nullable=False)
+    fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
 # Formulaire de contact
-class ContactForm(FlaskForm):
-    name = StringField('Nom', validators=[DataRequired()])
-    email = StringField('Email', validators=[DataRequired(), Email()])
-    message = TextAreaField('Message', validators=[DataRequired()])
-    submit = SubmitField('Envoyer')
-
-# Vues Admin
-admin.add_view(ModelView(Project, db.session))
-admin.add_view(ModelView(Testimonial, db.session))
-admin.add_view(ModelView(Contact, db.session))
-
-def fetch_github_assets(limit=4):
-    """Récupère les stats GitHub avec mise en cache légère."""
-    now = datetime.utcnow()
-    if (
-        GITHUB_CACHE["timestamp"]
-        and now - GITHUB_CACHE["timestamp"] < GITHUB_CACHE_DURATION
-        and GITHUB_CACHE["profile"]
-    ):
-        return GITHUB_CACHE["profile"], GITHUB_CACHE["repos"][:limit]
+@lru_cache(maxsize=None)
+def contact_form_class():
+    """Classe du formulaire de contact, construite au premier affichage de /contact."""
+    from flask_wtf import FlaskForm
+    from wtforms import StringField, TextAreaField, SubmitField
+    from wtforms.validators import DataRequired, Email
+
+    class ContactForm(FlaskForm):
+        name = StringField('Nom', validators=[DataRequired()])
+        email = StringField('Email', validators=[DataRequired(), Email()])
+        message = TextAreaField('Message', validators=[DataRequired()])
+        submit = SubmitField('Envoyer')
+
+    return ContactForm
+
+# Instrumentation : histogrammes Prometheus (/metrics) et en-tête Server-Timing
+# /metrics n'est servi qu'avec `Authorization: Bearer <METRICS_TOKEN>` ; non défini : 404
+app.config['METRICS_TOKEN'] = os.getenv('METRICS_TOKEN')
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+class Histogram:
+    """Histogramme Prometheus minimal, par combinaison de labels, propre au processus."""
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self._series.setdefault(labels, [0] * len(self.buckets) + [0, 0.0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        for labels, values in sorted(series.items()):
+            label_pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(self.labelnames, labels)]
+            for bound, count in zip(self.buckets, values):
+                bucket_labels = ','.join(label_pairs + [f'le="{bound}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {count}")
+            inf_labels = ','.join(label_pairs + ['le="+Inf"'])
+            lines.append(f"{self.name}_bucket{{{inf_labels}}} {values[-2]}")
+            suffix = '{' + ','.join(label_pairs) + '}' if label_pairs else ''
+            lines.append(f"{self.name}_count{suffix} {values[-2]}")
+            lines.append(f"{self.name}_sum{suffix} {values[-1]}")
+        return lines
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Durée des requêtes HTTP par route.', ('route', 'method', 'status')
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries', 'Requêtes SQL exécutées par requête HTTP.', ('route',), COUNT_BUCKETS
+)
+DB_QUERY_LATENCY = Histogram('db_query_duration_seconds', 'Durée des requêtes SQL.')
+TEMPLATE_LATENCY = Histogram('template_render_duration_seconds', 'Durée du rendu Jinja.', ('template',))
+OUTBOUND_LATENCY = Histogram(
+    'outbound_request_duration_seconds', 'Durée des appels sortants (GitHub, SMTP).', ('target',)
+)
+METRICS = (REQUEST_LATENCY, REQUEST_DB_QUERIES, DB_QUERY_LATENCY, TEMPLATE_LATENCY, OUTBOUND_LATENCY)
+
+# Profilage opt-in : les requêtes plus lentes que le seuil sont enregistrées dans PROFILE_DIR
+PROFILE_SLOW_REQUESTS_MS = float(os.getenv('PROFILE_SLOW_REQUESTS_MS', 0))
+PROFILE_DIR = Path(os.getenv('PROFILE_DIR', 'profiles'))
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    DB_QUERY_LATENCY.observe(elapsed)
+    if has_request_context() and 'timings' in g:
+        g.timings['db'] += elapsed
+        g.timings['db_count'] += 1
+
+@before_render_template.connect_via(app)
+def _before_render(sender, template, context, **extra):
+    if has_request_context():
+        g.setdefault('template_start', []).append(time.perf_counter())
+
+@template_rendered.connect_via(app)
+def _after_render(sender, template, context, **extra):
+    if not (has_request_context() and g.get('template_start')):
+        return
+    elapsed = time.perf_counter() - g.template_start.pop()
+    TEMPLATE_LATENCY.observe(elapsed, template.name or 'inline')
+    if 'timings' in g:
+        g.timings['tpl'] += elapsed
+
+@app.before_request
+def _start_request_timer():
+    g.timings = {"start": time.perf_counter(), "db": 0.0, "db_count": 0, "tpl": 0.0}
+    if PROFILE_SLOW_REQUESTS_MS:
+        g.profiler = _start_profiler()
+
+@app.after_request
+def _record_request_timing(response):
+    timings = g.get('timings')
+    if timings is None:
+        return response
+    elapsed = time.perf_counter() - timings["start"]
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    REQUEST_LATENCY.observe(elapsed, route, request.method, str(response.status_code))
+    REQUEST_DB_QUERIES.observe(timings["db_count"], route)
+    response.headers['Server-Timing'] = ', '.join([
+        f'app;dur={elapsed * 1000:.1f}',
+        # Valeur d'en-tête HTTP : ASCII uniquement
+        f'db;dur={timings["db"] * 1000:.1f};desc="{timings["db_count"]} queries"',
+        f'tpl;dur={timings["tpl"] * 1000:.1f}',
+    ])
+    if g.get('profiler') is not None:
+        _finish_profiler(g.pop('profiler'), elapsed)
+    return response
+
+def _start_profiler():
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    profiler = Profiler()
+    profiler.start()
+    return profiler
+
+def _finish_profiler(profiler, elapsed):
+    """Arrête le profileur et écrit un rapport si la requête dépasse le seuil."""
+    is_cprofile = hasattr(profiler, 'disable')
+    profiler.disable() if is_cprofile else profiler.stop()
+    if elapsed * 1000 < PROFILE_SLOW_REQUESTS_MS:
+        return
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    slug = request.path.strip('/').replace('/', '_') or 'index'
+    target = PROFILE_DIR / f"{datetime.utcnow():%Y%m%dT%H%M%S}-{slug}-{elapsed * 1000:.0f}ms"
+    if is_cprofile:
+        profiler.dump_stats(f"{target}.prof")
+    else:
+        target.with_suffix('.html').write_text(profiler.output_html())
+    app.logger.warning("Requête lente %s (%.0f ms), profil écrit dans %s", request.path, elapsed * 1000, target)
+
+@contextmanager
+def timed_outbound(target):
+    """Mesure un appel sortant (GitHub, SMTP) dans OUTBOUND_LATENCY."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        OUTBOUND_LATENCY.observe(time.perf_counter() - start, target)
+
+@app.route('/metrics')
+def metrics():
+    """Métriques du processus au format texte Prometheus (jeton METRICS_TOKEN requis)."""
+    token = app.config['METRICS_TOKEN']
+    if not token:
+        return app.response_class('Not Found\n', status=404, mimetype='text/plain')
+    supplied = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+        response = app.response_class('Unauthorized\n', status=401, mimetype='text/plain')
+        response.headers['WWW-Authenticate'] = 'Bearer'
+        return response
+    lines = []
+    for histogram in METRICS:
+        lines.extend(histogram.render())
+    return app.response_class('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+# Cache de pages complètes pour les routes quasi statiques
+class TTLCache:
+    """Cache LRU borné en nombre d'entrées et en durée de vie."""
+
+    def __init__(self, max_entries=128, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry["created"] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry, generation=None):
+        entry["created"] = time.monotonic()
+        with self._lock:
+            # Une invalidation pendant le calcul rend cette entrée obsolète
+            if generation is not None and generation != self.generation:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+class PageCache(TTLCache):
+    """Cache LRU de pages rendues, borné en nombre d'entrées et en durée de vie."""
+
+    def set(self, key, body, mimetype, generation):
+        entry = {"body": body, "mimetype": mimetype, "etag": hashlib.sha1(body).hexdigest(), "encoded": {}}
+        return self.put(key, entry, generation)
+
+    def encoded(self, entry, encoding):
+        """Corps compressé de l'entrée, calculé une seule fois par encodage."""
+        body = entry["encoded"].get(encoding)
+        if body is None:
+            body = entry["encoded"][encoding] = compress_body(entry["body"], encoding, PAGE_CACHE_COMPRESS_LEVELS[encoding])
+        return body
+
+
+PAGE_CACHE = PageCache(
+    max_entries=app.config['PAGE_CACHE_MAX_ENTRIES'],
+    ttl=app.config['PAGE_CACHE_TTL'],
+)
+
+def page_cache_key(query_args=()):
+    """Clé PAGE_CACHE : URL sans query string, plus les seuls paramètres lus par la vue.
+
+    Un paramètre ignoré par la vue (/?x=1, /?x=2…) ne crée pas d'entrée qui évincerait les vraies pages.
+    """
+    params = [(name, value) for name in sorted(query_args) for value in request.args.getlist(name)]
+    return f"{request.base_url}?{urlencode(params)}" if params else request.base_url
+
+def cached_page(view=None, *, query_args=()):
+    """Sert la page depuis PAGE_CACHE avec ETag / Cache-Control (304 si inchangée).
+
+    `query_args` : paramètres de la query string dont dépend la page (aucun par défaut).
+    """
+    if view is None:
+        return lambda view: cached_page(view, query_args=query_args)
 
-    profile = GITHUB_FALLBACK_PROFILE
-    repos = GITHUB_FALLBACK_REPOS
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        # Les messages flash sont propres à la session : pas de cache dans ce cas
+        if request.method != 'GET' or '_flashes' in session:
+            return view(*args, **kwargs)
 
-    if requests:
+        key = page_cache_key(query_args)
+        entry = PAGE_CACHE.get(key)
+        if entry is None:
+            generation = PAGE_CACHE.generation
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+            entry = PAGE_CACHE.set(key, response.get_data(), response.mimetype, generation)
+
+        # Les variantes compressées sont gardées avec l'entrée : pas de recompression à chaque hit
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+        if encoding is not None and len(entry["body"]) >= app.config['COMPRESS_MIN_SIZE']:
+            response = app.response_class(PAGE_CACHE.encoded(entry, encoding), mimetype=entry["mimetype"])
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f"{entry['etag']}-{encoding}")
+        else:
+            response = app.response_class(entry["body"], mimetype=entry["mimetype"])
+            response.set_etag(entry["etag"])
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = f"public, max-age={app.config['PAGE_CACHE_MAX_AGE']}"
+        return response.make_conditional(request)
+    # Repéré par warm_up() pour pré-rendre la page
+    wrapper.page_cache = True
+    return wrapper
+
+# Templates : fragments constants mis en cache et bytecode persistant
+FRAGMENT_CACHE = TTLCache(max_entries=256, ttl=app.config['FRAGMENT_CACHE_TTL'])
+
+class FragmentCacheExtension(Extension):
+    """Balise {% cache 'clé' %}...{% endcache %} : le bloc est rendu une fois puis servi depuis FRAGMENT_CACHE."""
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        body = parser.parse_statements(["name:endcache"], drop_needle=True)
+        return nodes.CallBlock(self.call_method("_render", [key]), [], [], body).set_lineno(lineno)
+
+    def _render(self, key, caller):
+        if not app.config['FRAGMENT_CACHE_ENABLED']:
+            return caller()
+        # url_for dépend du préfixe de montage (export statique, sous-répertoire)
+        if has_request_context():
+            key = (request.script_root, key)
+        entry = FRAGMENT_CACHE.get(key)
+        if entry is None:
+            entry = FRAGMENT_CACHE.put(key, {"html": caller()}, FRAGMENT_CACHE.generation)
+        return entry["html"]
+
+
+app.jinja_env.add_extension(FragmentCacheExtension)
+# Les listes constantes sont des globales Jinja : plus de context processor à chaque rendu
+app.jinja_env.globals.update(
+    portfolio_sites=PORTFOLIO_SITES,
+    venture_milestones=VENTURE_MILESTONES,
+    spotlight_projects=SPOTLIGHT_PROJECTS,
+    partner_network=PARTNER_NETWORK,
+    workflow_steps=WORKFLOW_STEPS,
+    github_username=GITHUB_USERNAME,
+)
+# Jinja exécute le code chargé depuis ce répertoire : il ne doit être accessible qu'à l'utilisateur du serveur
+if app.config['JINJA_BYTECODE_CACHE_DIR'] is None:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+elif app.config['JINJA_BYTECODE_CACHE_DIR']:
+    os.makedirs(app.config['JINJA_BYTECODE_CACHE_DIR'], mode=0o700, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config['JINJA_BYTECODE_CACHE_DIR'])
+
+def prerender_fragments():
+    """Rend les blocs {% cache %} de tous les templates hors requête ; renvoie le nombre de templates concernés."""
+    env = app.jinja_env
+    count = 0
+    with app.test_request_context('/'):
+        for name in env.list_templates(extensions=['html']):
+            source, filename, _ = env.loader.get_source(env, name)
+            if '{% cache' not in source:
+                continue
+            # Les blocs d'un template sont compilés ensemble et mis en cache de bytecode comme le template
+            bucket = None
+            if env.bytecode_cache is not None:
+                bucket = env.bytecode_cache.get_bucket(env, f"{name}#fragments", filename, source)
+            code = bucket.code if bucket is not None else None
+            if code is None:
+                blocks = [
+                    node for node in env.parse(source, name, filename).find_all(nodes.CallBlock)
+                    if isinstance(node.call.node, nodes.ExtensionAttribute)
+                    and node.call.node.identifier == FragmentCacheExtension.identifier
+                ]
+                # Compilés seuls, les blocs ne voient que les globales, comme attendu d'une section constante
+                code = env.compile(nodes.Template(blocks, lineno=1), name, filename)
+                if bucket is not None:
+                    bucket.code = code
+                    env.bytecode_cache.set_bucket(bucket)
+            env.template_class.from_code(env, code, env.make_globals(None)).render()
+            count += 1
+    return count
+
+# Assets statiques : Tailwind compilé, noms empreintés (static/dist), variantes .gz/.br et WebP
+ASSET_DIST = 'dist'
+ASSET_MAX_AGE = 365 * 24 * 3600
+ASSET_MANIFEST = {}
+# Formats textuels : seuls à recevoir des variantes .gz/.br (PNG, JPEG, WebP… sont déjà compressés)
+PRECOMPRESSED_SUFFIXES = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.xml'}
+TAILWIND_LAYERS = "@tailwind base;\n@tailwind components;\n@tailwind utilities;\n"
+
+def load_asset_manifest():
+    """Charge static/dist/manifest.json (nom logique -> nom empreinté) ; vide si les assets ne sont pas construits."""
+    path = Path(app.static_folder) / ASSET_DIST / 'manifest.json'
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    ASSET_MANIFEST.clear()
+    ASSET_MANIFEST.update(manifest)
+    return ASSET_MANIFEST
+
+load_asset_manifest()
+app.jinja_env.globals['asset_manifest'] = ASSET_MANIFEST
+
+@app.url_defaults
+def _fingerprint_static_url(endpoint, values):
+    # url_for('static', filename='css/site.css') -> /static/dist/css/site.<empreinte>.css
+    if endpoint == 'static' and values.get('filename') in ASSET_MANIFEST:
+        values['filename'] = f"{ASSET_DIST}/{ASSET_MANIFEST[values['filename']]}"
+
+def serve_static(filename):
+    """Sert static/ ; les fichiers empreintés sont immuables et servis précompressés si le client l'accepte."""
+    if not filename.startswith(f"{ASSET_DIST}/"):
+        return app.send_static_file(filename)
+    response = None
+    static_dir = Path(app.static_folder)
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings.quality(encoding) and (static_dir / f"{filename}{suffix}").is_file():
+            response = send_from_directory(
+                app.static_folder, f"{filename}{suffix}", mimetype=mimetypes.guess_type(filename)[0]
+            )
+            response.headers['Content-Encoding'] = encoding
+            break
+    if response is None:
+        response = app.send_static_file(filename)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+app.view_functions['static'] = serve_static
+
+def _compile_tailwind(static_dir):
+    """CSS minifié des classes Tailwind utilisées (templates, JS) suivi de custom.css ; None sans CLI Tailwind."""
+    binary = os.getenv('TAILWIND_BIN') or shutil.which('tailwindcss')
+    if not binary:
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = Path(tmp) / 'input.css', Path(tmp) / 'site.css'
+        # Même cascade que le CDN, qui injecte ses styles après custom.css
+        source.write_text((static_dir / 'css' / 'custom.css').read_text() + TAILWIND_LAYERS)
+        subprocess.run(
+            [binary, '-c', str(static_dir / 'js' / 'tailwind.config.js'), '-i', str(source), '-o', str(target), '--minify'],
+            cwd=app.root_path, check=True, capture_output=True,
+        )
+        return target.read_bytes()
+
+def _optimize_image(data):
+    """Réencode un PNG/JPEG sans perte visible et produit sa variante WebP ; inchangé sans Pillow."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return data, None
+    image = Image.open(io.BytesIO(data))
+    optimized, webp = io.BytesIO(), io.BytesIO()
+    if image.format == 'JPEG':
+        image.save(optimized, format='JPEG', optimize=True, progressive=True, quality='keep')
+    else:
+        image.save(optimized, format=image.format, optimize=True)
+    image.save(webp, format='WEBP', quality=85, method=6)
+    return min(data, optimized.getvalue(), key=len), webp.getvalue()
+
+def build_assets(dist=None):
+    """Reconstruit `dist` (static/dist par défaut) et son manifeste ; retourne le manifeste
+    {nom logique: nom empreinté}. Seul le build de static/dist change le manifeste servi.
+    """
+    static_dir = Path(app.static_folder)
+    live = static_dir / ASSET_DIST
+    dist = live if dist is None else Path(dist)
+    shutil.rmtree(dist, ignore_errors=True)
+    manifest = {}
+
+    def emit(logical, data):
+        suffix = Path(logical).suffix
+        fingerprint = hashlib.sha256(data).hexdigest()[:10]
+        hashed = Path(logical).with_suffix(f".{fingerprint}{suffix}").as_posix()
+        if suffix in PRECOMPRESSED_SUFFIXES:
+            write_precompressed(dist / hashed, data)
+        else:
+            (dist / hashed).parent.mkdir(parents=True, exist_ok=True)
+            (dist / hashed).write_bytes(data)
+        manifest[logical] = hashed
+
+    for source in sorted(static_dir.rglob('*')):
+        if not source.is_file() or live in source.parents or dist in source.parents:
+            continue
+        relative = source.relative_to(static_dir).as_posix()
+        data = source.read_bytes()
+        if source.suffix.lower() in ('.png', '.jpg', '.jpeg'):
+            data, webp = _optimize_image(data)
+            if webp is not None:
+                emit(Path(relative).with_suffix('.webp').as_posix(), webp)
+        emit(relative, data)
+
+    css = _compile_tailwind(static_dir)
+    if css is not None:
+        emit('css/site.css', css)
+
+    (dist / 'manifest.json').write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    if dist != live:
+        return manifest
+    load_asset_manifest()
+    # Les pages et fragments déjà rendus pointent encore vers les anciennes URLs
+    PAGE_CACHE.clear()
+    FRAGMENT_CACHE.clear()
+    return manifest
+
+# Administration : Flask-Admin n'est importé qu'au premier accès à /admin
+# Admin : listes sans colonnes Text, nombre de lignes estimé et mis en cache, pagination par clé
+ADMIN_PAGE_SIZE = int(os.getenv('ADMIN_PAGE_SIZE', 50))
+ADMIN_COUNT_LIMIT = int(os.getenv('ADMIN_COUNT_LIMIT', 10000))
+ADMIN_COUNT_TTL = int(os.getenv('ADMIN_COUNT_TTL', 60))
+# Nombre de lignes par liste (vue, recherche, filtres) et dernière clé de chaque page déjà servie
+ADMIN_COUNTS = TTLCache(256, ADMIN_COUNT_TTL)
+ADMIN_PAGE_KEYS = TTLCache(4096, ADMIN_COUNT_TTL)
+
+def admin_row_count(model, query, filtered):
+    """Nombre de lignes affiché par l'admin.
+
+    Table entière : estimation du planificateur sous PostgreSQL, COUNT(*) sinon.
+    Liste filtrée ou recherche : COUNT(*) borné à ADMIN_COUNT_LIMIT lignes.
+    """
+    if not filtered:
+        if db.engine.dialect.name == 'postgresql':
+            estimate = db.session.execute(
+                db.text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": model.__tablename__},
+            ).scalar()
+            if estimate and estimate > 0:
+                return estimate
+        return db.session.query(db.func.count(model.id)).scalar()
+    bounded = query.with_entities(model.id).limit(ADMIN_COUNT_LIMIT).subquery()
+    return db.session.query(db.func.count()).select_from(bounded).scalar()
+
+def create_admin_app():
+    """Construit l'application Flask-Admin servie sous /admin par LazyAdminMiddleware."""
+    from flask_admin import Admin
+    from flask_admin.contrib.sqla import ModelView
+    from sqlalchemy.orm import lazyload
+    from wtforms.validators import Optional
+
+    class LargeTableView(ModelView):
+        """ModelView pour les grosses tables.
+
+        La liste ne charge que les colonnes de column_list et trie sur des colonnes
+        indexées (id en dernier critère). Le nombre de lignes vient de
+        admin_row_count(), en cache ADMIN_COUNT_TTL secondes. La recherche passe par
+        l'index plein texte quand la table en a un. La page suivante d'une page déjà
+        servie est lue après sa dernière clé plutôt qu'avec OFFSET.
+        """
+
+        page_size = ADMIN_PAGE_SIZE
+        can_set_page_size = False
+        column_display_pk = True
+        column_default_sort = ('id', True)
+
+        def get_list(self, page, sort_column, sort_desc, search, filters, execute=True, page_size=None):
+            model, pk = self.model, self.model.id
+            query, joins = self.session.query(model), {}
+            terms = (search or '').split()
+            if terms and model.__tablename__ in SEARCH_COLUMNS:
+                query = query.filter(full_text_filter(model, terms))
+            elif terms and self._search_supported:
+                query, _, joins, _ = self._apply_search(query, None, joins, {}, search)
+            if filters and self._filters:
+                query, _, joins, _ = self._apply_filters(query, None, joins, {}, filters)
+
+            list_key = (self.endpoint, search, tuple(filters or ()))
+            generation = ADMIN_COUNTS.generation
+            entry = ADMIN_COUNTS.get(list_key) or ADMIN_COUNTS.put(
+                list_key, {"count": admin_row_count(model, query, bool(terms or filters))}, generation
+            )
+
+            column = self._sortable_columns.get(sort_column)
+            if column is None:
+                column, sort_desc = pk, True
+            direction = db.desc if sort_desc else db.asc
+            query = query.order_by(direction(column), direction(pk)) if column is not pk else query.order_by(direction(pk))
+            # Seek uniquement sur une colonne sans NULL (les NULL sortent de la comparaison de tuples)
+            seekable = column is pk or not model.__table__.c[column.key].nullable
+
+            page, page_size = page or 0, self.page_size if page_size is None else page_size
+            keys_key = list_key + (sort_column, bool(sort_desc), page_size)
+            boundary = ADMIN_PAGE_KEYS.get(keys_key + (page - 1,)) if page and seekable else None
+            if boundary is not None:
+                key = boundary["key"]
+                if column is pk:
+                    query = query.filter(pk < key[1] if sort_desc else pk > key[1])
+                else:
+                    query = query.filter(db.tuple_(column, pk) < key if sort_desc else db.tuple_(column, pk) > key)
+            elif page and page_size:
+                query = query.offset(page * page_size)
+            if page_size:
+                query = query.limit(page_size)
+
+            attributes = {pk, column} | {
+                getattr(model, name) for name, _ in self._list_columns if name in model.__table__.c
+            }
+            query = query.options(load_only(*attributes), lazyload('*'))
+            if not execute:
+                return entry["count"], query
+            rows = query.all()
+            if seekable and page_size and len(rows) == page_size:
+                last = rows[-1]
+                ADMIN_PAGE_KEYS.put(keys_key + (page,), {"key": (getattr(last, column.key), last.id)})
+            return entry["count"], rows
+
+        def after_model_change(self, form, model, is_created):
+            ADMIN_COUNTS.clear()
+            ADMIN_PAGE_KEYS.clear()
+
+        def after_model_delete(self, model):
+            ADMIN_COUNTS.clear()
+            ADMIN_PAGE_KEYS.clear()
+
+    class CachedModelView(LargeTableView):
+        """Vue de contenu public : invalide aussi le cache de pages après chaque modification."""
+
+        def after_model_change(self, form, model, is_created):
+            super().after_model_change(form, model, is_created)
+            PAGE_CACHE.clear()
+
+        def after_model_delete(self, model):
+            super().after_model_delete(model)
+            PAGE_CACHE.clear()
+
+    class ProjectView(CachedModelView):
+        column_list = ('id', 'name', 'stack', 'github_url', 'created_at')
+        column_sortable_list = ('id', 'created_at')
+        column_searchable_list = SEARCH_COLUMNS['project']
+        # created_at est NOT NULL mais reste facultatif dans le formulaire : vide -> date
+        # précédente en édition, date du jour en création
+        form_args = {'created_at': {'validators': [Optional()]}}
+
+        def on_model_change(self, form, model, is_created):
+            super().on_model_change(form, model, is_created)
+            if model.created_at is None:
+                previous = inspect(model).attrs.created_at.history.deleted
+                model.created_at = previous[0] if previous and previous[0] else datetime.utcnow()
+
+    class TestimonialView(CachedModelView):
+        column_list = ('id', 'client_name', 'company', 'rating', 'created_at')
+        column_sortable_list = ('id', 'rating')
+        column_searchable_list = ('client_name', 'company')
+
+    class ContactView(LargeTableView):
+        column_list = ('id', 'name', 'email', 'created_at')
+        column_sortable_list = ('id', 'created_at')
+        column_searchable_list = SEARCH_COLUMNS['contact']
+
+    class OutboxView(LargeTableView):
+        column_list = ('id', 'subject', 'recipients', 'attempts', 'next_attempt_at', 'sent_at', 'created_at')
+        column_sortable_list = ('id', 'next_attempt_at', 'sent_at')
+
+    admin_app = Flask(__name__)
+    admin_app.config.from_mapping(app.config)
+    db.init_app(admin_app)
+    # Moteur et pool de l'application principale : pas de second pool de connexions
+    # par worker, et le préchauffage de _open_db_pool() sert aussi l'admin.
+    # Flask-SQLAlchemy 3.0 n'a pas d'API publique pour partager un moteur entre deux
+    # applications (create_engine(pool=...) est refusé, echo_pool étant toujours passé) :
+    # on remplace les moteurs de l'admin dans SQLAlchemy._app_engines. Version figée dans
+    # requirements.txt ; si l'attribut disparaît, on échoue plutôt que d'ouvrir un second pool.
+    if not isinstance(getattr(db, '_app_engines', None), MutableMapping):
+        raise RuntimeError("Flask-SQLAlchemy incompatible : impossible de partager le moteur avec l'admin")
+    with app.app_context():
+        shared_engines = db.engines
+    for engine in db._app_engines[admin_app].values():
+        engine.dispose()
+    db._app_engines[admin_app] = shared_engines
+    admin = Admin(admin_app, name='Cognito Admin', template_mode='bootstrap4', url='/admin')
+    admin.add_view(ProjectView(Project, db.session))
+    admin.add_view(TestimonialView(Testimonial, db.session))
+    admin.add_view(ContactView(Contact, db.session))
+    admin.add_view(OutboxView(OutboxMessage, db.session, name='Outbox'))
+    return admin_app
+
+
+class LazyAdminMiddleware:
+    """Délègue les URL /admin à create_admin_app(), construite au premier accès."""
+
+    def __init__(self, wsgi_app, prefix='/admin'):
+        self.wsgi_app = wsgi_app
+        self.prefix = prefix
+        self._admin_app = None
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if path == self.prefix or path.startswith(self.prefix + '/'):
+            if self._admin_app is None:
+                with self._lock:
+                    if self._admin_app is None:
+                        self._admin_app = create_admin_app()
+            return self._admin_app(environ, start_response)
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = LazyAdminMiddleware(app.wsgi_app)
+
+# Compression des réponses : br, zstd ou gzip selon Accept-Encoding
+COMPRESSIBLE_MIMETYPES = ('text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml')
+# Les pages en cache ne sont compressées qu'une fois par entrée : niveaux élevés
+PAGE_CACHE_COMPRESS_LEVELS = {'br': 10, 'zstd': 12, 'gzip': 9}
+
+class _BrotliStream:
+    """Adapte brotli.Compressor à l'interface compress()/flush() de zlib."""
+
+    def __init__(self, level, size=None):
+        import brotli
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+@lru_cache(maxsize=None)
+def compression_codecs():
+    """Encodages disponibles par ordre de préférence du serveur : {nom: fabrique(niveau, taille) -> compresseur en flux}.
+
+    La taille, quand elle est connue, permet à zstd de choisir une fenêtre adaptée (bien plus rapide).
+    """
+    codecs = {}
+    try:
+        import brotli  # noqa: F401
+        codecs['br'] = _BrotliStream
+    except ImportError:
+        pass
+    try:
+        from compression import zstd  # Python 3.14+
+
+        def zstd_stream(level, size=None):
+            compressor = zstd.ZstdCompressor(level=level)
+            if size is not None:
+                compressor.set_pledged_input_size(size)
+            return compressor
+        codecs['zstd'] = zstd_stream
+    except ImportError:
         try:
-            profile_resp = requests.get(
-                f"https://api.github.com/users/{GITHUB_USERNAME}", timeout=5
+            import zstandard
+            codecs['zstd'] = lambda level, size=None: zstandard.ZstdCompressor(level=level).compressobj(
+                size=-1 if size is None else size
             )
-            if profile_resp.ok:
-                data = profile_resp.json()
-                profile = {
-                    "name": data.get("name") or data.get("login"),
-                    "login": data.get("login", GITHUB_USERNAME),
-                    "followers": data.get("followers", 0),
-                    "public_repos": data.get("public_repos", 0),
-                    "public_gists": data.get("public_gists", 0),
-                    "html_url": data.get("html_url"),
-                    "blog": data.get("blog"),
-                    "company": data.get("company"),
-                    "bio": data.get("bio"),
-                }
-        except RequestException:
+        except ImportError:
             pass
+    codecs['gzip'] = lambda level, size=None: zlib.compressobj(level, zlib.DEFLATED, 31)
+    return codecs
+
+def negotiate_encoding(accept_encoding):
+    """Encodage préféré par le client parmi compression_codecs(), ou None."""
+    if not accept_encoding:
+        return None
+    accepted = parse_accept_header(accept_encoding)
+    best, best_quality = None, 0
+    for encoding in compression_codecs():
+        quality = accepted.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def compress_body(data, encoding, level):
+    compressor = compression_codecs()[encoding](level, len(data))
+    return compressor.compress(data) + compressor.flush()
+
+class CompressionMiddleware:
+    """Compresse en flux les réponses textuelles d'au moins `min_size` octets (ou de taille inconnue)."""
+
+    def __init__(self, wsgi_app, min_size=1024, levels=None):
+        self.wsgi_app = wsgi_app
+        self.min_size = min_size
+        self.levels = levels or {}
+
+    def _compressible(self, status, headers):
+        if not status.startswith('200') or 'Content-Encoding' in headers:
+            return False
+        if 'no-transform' in headers.get('Cache-Control', ''):
+            return False
+        if not headers.get('Content-Type', '').startswith(COMPRESSIBLE_MIMETYPES):
+            return False
+        length = headers.get('Content-Length', type=int)
+        return length is None or length >= self.min_size
 
+    def __call__(self, environ, start_response):
+        encoding = negotiate_encoding(environ.get('HTTP_ACCEPT_ENCODING'))
+        if encoding is None or environ.get('REQUEST_METHOD') == 'HEAD':
+            return self.wsgi_app(environ, start_response)
+
+        compressors = []
+
+        def compressing_start_response(status, headers, exc_info=None):
+            headers = Headers(headers)
+            if self._compressible(status, headers):
+                size = headers.get('Content-Length', type=int)
+                compressors.append(compression_codecs()[encoding](self.levels.get(encoding, 6), size))
+                headers.remove('Content-Length')
+                headers['Content-Encoding'] = encoding
+                if 'accept-encoding' not in headers.get('Vary', '').lower():
+                    headers['Vary'] = ', '.join(filter(None, [headers.get('Vary'), 'Accept-Encoding']))
+                # Le corps change : l'ETag forte de la version non compressée ne s'applique plus
+                etag = headers.get('ETag')
+                if etag and not etag.startswith('W/'):
+                    headers['ETag'] = f"W/{etag}"
+            return start_response(status, headers.to_wsgi_list(), exc_info)
+
+        app_iter = self.wsgi_app(environ, compressing_start_response)
+        if not compressors:
+            return app_iter
+        return self._compress(app_iter, compressors[0])
+
+    @staticmethod
+    def _compress(app_iter, compressor):
         try:
-            repos_resp = requests.get(
-                f"https://api.github.com/users/{GITHUB_USERNAME}/repos?per_page=100",
-                timeout=5,
-            )
-            if repos_resp.ok:
-                repo_data = repos_resp.json()
-                repo_data = sorted(
-                    repo_data,
-                    key=lambda r: (
-                        r.get("stargazers_count", 0),
-                        r.get("forks_count", 0),
-                        r.get("pushed_at") or r.get("updated_at") or "",
-                    ),
-                    reverse=True,
-                )
-                repos = [
-                    {
-                        "name": repo.get("name"),
-                        "description": repo.get("description"),
-                        "html_url": repo.get("html_url"),
-                        "language": repo.get("language"),
-                        "stargazers_count": repo.get("stargazers_count", 0),
-                        "pushed_at": repo.get("pushed_at") or repo.get("updated_at"),
-                    }
-                    for repo in repo_data[: limit or 4]
-                ]
+            for chunk in app_iter:
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+            yield compressor.flush()
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+
+app.wsgi_app = CompressionMiddleware(
+    app.wsgi_app,
+    min_size=app.config['COMPRESS_MIN_SIZE'],
+    levels={
+        'br': app.config['COMPRESS_LEVEL_BR'],
+        'zstd': app.config['COMPRESS_LEVEL_ZSTD'],
+        'gzip': app.config['COMPRESS_LEVEL_GZIP'],
+    },
+)
+
+# Synchronisation GitHub : sync_github() copie l'API dans les tables github_* (snapshot) ;
+# les routes ne lisent que ce snapshot et n'appellent jamais api.github.com.
+HTTP_CLIENT = {"session": None}
+
+def get_http_session():
+    """Session requests partagée (connexions keep-alive), ou None si requests est absent."""
+    if HTTP_CLIENT["session"] is None:
+        try:
+            import requests
+        except ImportError:
+            return None
+        HTTP_CLIENT["session"] = requests.Session()
+    return HTTP_CLIENT["session"]
+
+def _github_conditional_headers(state):
+    headers = {}
+    if state and state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state and state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+def _github_handle_response(plan, fetched, path, resp, normalize):
+    """Traite une réponse (requests ou httpx) : un 304 réutilise les données connues, un 200 est
+    noté dans `fetched` pour apply_github_sync(). Retourne les données à jour, ou None si indisponibles.
+    """
+    state = plan["states"].get(path)
+    if resp.status_code == 304 and state:
+        return state["data"]
+    if not 200 <= resp.status_code < 300:
+        return state["data"] if state else None
+    data = normalize(resp.json())
+    fetched[path] = {
+        "data": data,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+    }
+    return data
+
+def _normalize_github_profile(data):
+    return {
+        "name": data.get("name") or data.get("login"),
+        "login": data.get("login", GITHUB_USERNAME),
+        "followers": data.get("followers", 0),
+        "public_repos": data.get("public_repos", 0),
+        "public_gists": data.get("public_gists", 0),
+        "html_url": data.get("html_url"),
+        "blog": data.get("blog"),
+        "company": data.get("company"),
+        "bio": data.get("bio"),
+    }
+
+def _normalize_github_repos(repo_data):
+    return [
+        {
+            "name": repo.get("name"),
+            "description": repo.get("description"),
+            "html_url": repo.get("html_url"),
+            "language": repo.get("language"),
+            "topics": repo.get("topics") or [],
+            "stargazers_count": repo.get("stargazers_count", 0),
+            "forks_count": repo.get("forks_count", 0),
+            "pushed_at": repo.get("pushed_at") or repo.get("updated_at"),
+        }
+        for repo in repo_data
+    ]
+
+def _normalize_github_languages(data):
+    return {language: int(size) for language, size in data.items()}
+
+def _build_github_repo_index(repos):
+    """Trie les dépôts une fois pour toutes et construit les index langage / topic.
+
+    Chaque liste de l'index conserve l'ordre global, les routes n'ont plus qu'à
+    la découper. Un dépôt est indexé sous chacun de ses langages.
+    """
+    repos = sorted(
+        repos,
+        key=lambda r: (
+            r.get("stargazers_count", 0),
+            r.get("forks_count", 0),
+            r.get("pushed_at") or "",
+        ),
+        reverse=True,
+    )
+    by_language, by_topic = {}, {}
+    for repo in repos:
+        languages = {language.lower() for language in repo.get("languages") or []}
+        if repo.get("language"):
+            languages.add(repo["language"].lower())
+        for language in languages:
+            by_language.setdefault(language, []).append(repo)
+        for topic in repo.get("topics") or []:
+            by_topic.setdefault(topic.lower(), []).append(repo)
+    return {"repos": repos, "repos_by_language": by_language, "repos_by_topic": by_topic}
+
+GITHUB_PROFILE_PATH = f"/users/{GITHUB_USERNAME}"
+GITHUB_REPOS_PAGE_SIZE = 100
+GITHUB_REPOS_MAX_PAGES = 10
+
+def _github_repos_path(page):
+    return f"/users/{GITHUB_USERNAME}/repos?per_page={GITHUB_REPOS_PAGE_SIZE}&page={page}"
+
+def _github_languages_path(repo_name):
+    return f"/repos/{GITHUB_USERNAME}/{repo_name}/languages"
+
+def github_repos_to_refresh(plan, repos):
+    """Dépôts nouveaux ou poussés depuis la dernière sync : seuls leurs langages sont redemandés."""
+    return [repo for repo in repos if plan["pushed"].get(repo["name"]) != repo["pushed_at"]]
+
+def claim_github_sync(force=False):
+    """Bail de synchronisation partagé par les workers : True si cet appel doit synchroniser."""
+    now = datetime.utcnow()
+    try:
+        if db.session.get(GitHubProfile, GITHUB_USERNAME) is None:
+            db.session.add(GitHubProfile(login=GITHUB_USERNAME, synced_at=now))
+            db.session.commit()
+            return True
+        query = GitHubProfile.query.filter(GitHubProfile.login == GITHUB_USERNAME)
+        if not force:
+            stale = now - timedelta(seconds=GITHUB_SYNC_INTERVAL)
+            query = query.filter(db.or_(GitHubProfile.synced_at.is_(None), GitHubProfile.synced_at < stale))
+        claimed = query.update({GitHubProfile.synced_at: now}, synchronize_session=False)
+        db.session.commit()
+        return bool(claimed)
+    except SQLAlchemyError:
+        # Premier démarrage concurrent (clé déjà insérée) ou tables pas encore créées
+        db.session.rollback()
+        return False
+
+def github_sync_plan():
+    """Validateurs et données des dernières réponses, pushed_at connu de chaque dépôt."""
+    plan = {
+        "states": {
+            state.path: {
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "data": json.loads(state.data),
+            }
+            for state in GitHubSyncState.query
+        },
+        "pushed": dict(db.session.query(GitHubRepo.name, GitHubRepo.pushed_at)),
+    }
+    # Aucune transaction ne reste ouverte pendant les appels réseau
+    db.session.commit()
+    return plan
+
+def github_sync_fetch(plan):
+    """Phase réseau de la sync, sans I/O : générateur qui produit des lots de requêtes
+    [(chemin, en-têtes)] et reçoit la liste des réponses (requests ou httpx, None si la
+    requête a échoué). Sa valeur de retour est le résultat attendu par apply_github_sync().
+
+    Les requêtes d'un même lot sont indépendantes : le client peut les envoyer en parallèle.
+    """
+    fetched = {}
+
+    def batch(*paths):
+        return [(path, _github_conditional_headers(plan["states"].get(path))) for path in paths]
+
+    def handle(path, resp, normalize):
+        if resp is None:
+            state = plan["states"].get(path)
+            return state["data"] if state else None
+        return _github_handle_response(plan, fetched, path, resp, normalize)
+
+    # Profil en parallèle de la première page de dépôts
+    profile_resp, page_resp = yield batch(GITHUB_PROFILE_PATH, _github_repos_path(1))
+    profile = handle(GITHUB_PROFILE_PATH, profile_resp, _normalize_github_profile)
+    repos, complete = [], True
+    for page in range(1, GITHUB_REPOS_MAX_PAGES + 1):
+        if page > 1:
+            (page_resp,) = yield batch(_github_repos_path(page))
+        page_repos = handle(_github_repos_path(page), page_resp, _normalize_github_repos)
+        if page_repos is None:
+            complete = False
+            break
+        repos.extend(page_repos)
+        if len(page_repos) < GITHUB_REPOS_PAGE_SIZE:
+            break
+
+    changed = github_repos_to_refresh(plan, repos)
+    paths = [_github_languages_path(repo["name"]) for repo in changed]
+    responses = (yield batch(*paths)) if paths else []
+    return {
+        "profile": profile,
+        "repos": repos,
+        "complete": complete,
+        "languages": {
+            repo["name"]: handle(path, resp, _normalize_github_languages)
+            for repo, path, resp in zip(changed, paths, responses)
+        },
+        "fetched": fetched,
+    }
+
+def _fetch_github_sync(session, plan):
+    """Exécute github_sync_fetch() avec requests, chaque lot dans GITHUB_EXECUTOR."""
+    from requests.exceptions import RequestException
+
+    def get(request):
+        path, headers = request
+        try:
+            with timed_outbound('github'):
+                return session.get(f"{GITHUB_API_URL}{path}", headers=headers, timeout=10)
         except RequestException:
-            pass
+            return None
+
+    steps = github_sync_fetch(plan)
+    requests_batch = next(steps)
+    while True:
+        try:
+            requests_batch = steps.send(list(GITHUB_EXECUTOR.map(get, requests_batch)))
+        except StopIteration as stop:
+            return stop.value
+
+def apply_github_sync(result):
+    """Écrit le résultat de la phase réseau dans le snapshot ; retourne le nombre de dépôts modifiés."""
+    now = datetime.utcnow()
+    for path, response in result["fetched"].items():
+        db.session.merge(
+            GitHubSyncState(
+                path=path,
+                etag=response["etag"],
+                last_modified=response["last_modified"],
+                data=json.dumps(response["data"]),
+                fetched_at=now,
+            )
+        )
+
+    profile = db.session.get(GitHubProfile, GITHUB_USERNAME)
+    if profile is None:
+        profile = GitHubProfile(login=GITHUB_USERNAME)
+        db.session.add(profile)
+    changed = 0
+    if result["profile"]:
+        for field, value in result["profile"].items():
+            if field != "login" and getattr(profile, field) != value:
+                setattr(profile, field, value)
+                changed += 1
+
+    existing = {repo.name: repo for repo in GitHubRepo.query}
+    columns = ("description", "html_url", "language", "stargazers_count", "forks_count", "pushed_at")
+    for data in result["repos"]:
+        repo = existing.pop(data["name"], None)
+        if repo is None:
+            repo = GitHubRepo(name=data["name"])
+            db.session.add(repo)
+        languages = result["languages"].get(data["name"])
+        if data["name"] in result["languages"] and languages is None:
+            # Langages indisponibles : pushed_at inchangé pour les redemander à la prochaine sync
+            data = dict(data, pushed_at=repo.pushed_at)
+        dirty = False
+        for column in columns:
+            if getattr(repo, column) != data[column]:
+                setattr(repo, column, data[column])
+                dirty = True
+        topics = [topic[:50] for topic in dict.fromkeys(data["topics"])]
+        if [entry.topic for entry in repo.topics] != sorted(topics):
+            repo.topics = [GitHubRepoTopic(topic=topic) for topic in sorted(topics)]
+            dirty = True
+        if languages is not None:
+            repo.languages = [
+                GitHubRepoLanguage(language=language[:50], bytes=size) for language, size in languages.items()
+            ]
+            dirty = True
+        changed += dirty
+    # Dépôts supprimés ou renommés : seulement si toutes les pages ont été lues
+    if result["complete"]:
+        for repo in existing.values():
+            db.session.delete(repo)
+            changed += 1
 
+    profile.synced_at = now
+    if changed or profile.changed_at is None:
+        profile.changed_at = now
+    db.session.commit()
+    return changed
+
+def sync_github(force=False):
+    """Synchronise le snapshot GitHub depuis l'API (requêtes conditionnelles, langages des seuls
+    dépôts poussés) ; retourne le nombre de dépôts modifiés, ou None si la sync n'était pas due.
+    """
+    if not claim_github_sync(force):
+        return None
+    session = get_http_session()
+    if session is None:
+        return 0
+    changed = apply_github_sync(_fetch_github_sync(session, github_sync_plan()))
+    load_github_snapshot(force=True)
+    return changed
+
+def load_github_snapshot(force=False):
+    """Recharge GITHUB_CACHE depuis les tables github_* si le snapshot a changé.
+
+    La version (GitHubProfile.changed_at, lue par clé primaire) n'est vérifiée
+    qu'une fois toutes les GITHUB_SNAPSHOT_CHECK_INTERVAL secondes.
+    """
+    now = time.monotonic()
+    if not force and now - GITHUB_SNAPSHOT["checked"] < GITHUB_SNAPSHOT_CHECK_INTERVAL:
+        return
+    GITHUB_SNAPSHOT["checked"] = now
+    profile = db.session.get(GitHubProfile, GITHUB_USERNAME)
+    if profile is None:
+        return
+    GITHUB_CACHE["timestamp"] = profile.synced_at
+    if profile.changed_at == GITHUB_SNAPSHOT["version"]:
+        return
+    repos = [
+        repo.as_dict()
+        for repo in GitHubRepo.query.order_by(
+            GitHubRepo.stargazers_count.desc(), GitHubRepo.forks_count.desc(), GitHubRepo.pushed_at.desc()
+        )
+    ]
     GITHUB_CACHE.update(
         {
-            "profile": profile,
-            "repos": repos,
-            "timestamp": now,
+            # Profil jamais récupéré (API injoignable dès la première sync) : constantes de secours
+            "profile": profile.as_dict() if profile.html_url else None,
+            **_build_github_repo_index(repos),
         }
     )
+    GITHUB_SNAPSHOT["version"] = profile.changed_at
+    PAGE_CACHE.clear()
+
+def refresh_github_cache():
+    """Synchronise le snapshot si la sync est due (bloquant, à appeler dans un contexte d'application)."""
+    sync_github()
+    load_github_snapshot(force=True)
+
+def _refresh_github_cache_worker():
+    try:
+        with app.app_context():
+            refresh_github_cache()
+    except Exception:
+        app.logger.exception("Synchronisation GitHub impossible")
+    finally:
+        with GITHUB_REFRESH_LOCK:
+            GITHUB_REFRESH_STATE["running"] = False
+
+def schedule_github_refresh():
+    """Lance une sync en arrière-plan, une seule à la fois par processus."""
+    with GITHUB_REFRESH_LOCK:
+        if GITHUB_REFRESH_STATE["running"]:
+            return False
+        GITHUB_REFRESH_STATE["running"] = True
+    if GITHUB_REFRESH_STATE["scheduler"] is not None:
+        GITHUB_REFRESH_STATE["scheduler"]()
+        return True
+    threading.Thread(
+        target=_refresh_github_cache_worker,
+        name="github-refresh",
+        daemon=True,
+    ).start()
+    return True
+
+GITHUB_FALLBACK_INDEX = _build_github_repo_index(GITHUB_FALLBACK_REPOS)
+
+def fetch_github_assets(limit=4, language=None, topic=None):
+    """Stats GitHub lues dans le snapshot local (constantes de secours s'il est vide).
+
+    Le cache contient l'index complet des dépôts, déjà trié : chaque route
+    n'en prend que les `limit` premiers, éventuellement filtrés par langage
+    ou par topic. Une sync en arrière-plan est lancée si le snapshot a plus de
+    GITHUB_SYNC_INTERVAL secondes (0 : seulement via `flask sync-github`).
+    """
+    try:
+        load_github_snapshot()
+    except SQLAlchemyError:
+        db.session.rollback()
+        app.logger.exception("Lecture du snapshot GitHub impossible (flask upgrade-db ?)")
+
+    synced_at = GITHUB_CACHE["timestamp"]
+    if GITHUB_SYNC_INTERVAL and (
+        synced_at is None or datetime.utcnow() - synced_at > timedelta(seconds=GITHUB_SYNC_INTERVAL)
+    ):
+        schedule_github_refresh()
+
+    profile = GITHUB_CACHE["profile"] or GITHUB_FALLBACK_PROFILE
+    index = GITHUB_CACHE if GITHUB_CACHE["repos"] else GITHUB_FALLBACK_INDEX
+    if language:
+        repos = index["repos_by_language"].get(language.lower(), [])
+    elif topic:
+        repos = index["repos_by_topic"].get(topic.lower(), [])
+    else:
+        repos = index["repos"]
     return profile, repos[:limit]
 
+# File d'envoi des emails : le POST /contact n'attend jamais le serveur SMTP
+OUTBOX_BATCH_SIZE = 20
+OUTBOX_MAX_ATTEMPTS = 6
+OUTBOX_RETRY_DELAY = timedelta(seconds=30)
+OUTBOX_LEASE = timedelta(minutes=5)
+OUTBOX_POLL_INTERVAL = 30
+OUTBOX_LOCK = threading.Lock()
+OUTBOX_STATE = {"running": False}
+OUTBOX_WAKEUP = threading.Event()
+
+def enqueue_mail(subject, recipients, body, sender=None):
+    """Ajoute un email à la file ; il est commité avec la transaction en cours."""
+    db.session.add(
+        OutboxMessage(
+            subject=subject,
+            sender=sender,
+            recipients=','.join(recipients),
+            body=body,
+        )
+    )
+
+def get_mail():
+    """Extension Flask-Mail, initialisée au premier envoi."""
+    state = app.extensions.get('mail')
+    if state is None:
+        from flask_mail import Mail
+        state = Mail().init_app(app)
+    return state
+
+def claim_outbox_batch():
+    """Réserve un lot de messages à envoyer (bail exclusif entre workers)."""
+    now = datetime.utcnow()
+    available = db.or_(OutboxMessage.locked_until.is_(None), OutboxMessage.locked_until < now)
+    candidates = (
+        db.session.query(OutboxMessage.id)
+        .filter(
+            OutboxMessage.sent_at.is_(None),
+            OutboxMessage.attempts < OUTBOX_MAX_ATTEMPTS,
+            OutboxMessage.next_attempt_at <= now,
+            available,
+        )
+        .order_by(OutboxMessage.id)
+        .limit(OUTBOX_BATCH_SIZE)
+        .all()
+    )
+    claimed = [
+        message_id
+        for (message_id,) in candidates
+        if OutboxMessage.query.filter(OutboxMessage.id == message_id, available).update(
+            {OutboxMessage.locked_until: now + OUTBOX_LEASE}, synchronize_session=False
+        )
+    ]
+    db.session.commit()
+    if not claimed:
+        return []
+    return OutboxMessage.query.filter(OutboxMessage.id.in_(claimed)).order_by(OutboxMessage.id).all()
+
+def record_outbox_delivery(message, error=None):
+    """Marque `message` envoyé, ou programme sa prochaine tentative (backoff exponentiel) si `error`."""
+    message.locked_until = None
+    if error is None:
+        message.sent_at = datetime.utcnow()
+        return
+    message.attempts += 1
+    message.last_error = str(error)
+    message.next_attempt_at = datetime.utcnow() + OUTBOX_RETRY_DELAY * 2 ** (message.attempts - 1)
+    if message.attempts >= OUTBOX_MAX_ATTEMPTS:
+        app.logger.error("Abandon de l'email %s après %s tentatives : %s", message.id, message.attempts, error)
+
+def record_outbox_results(results):
+    """Enregistre les résultats {id: None ou erreur} d'un lot envoyé hors session (ex. asgi.py)."""
+    for message in OutboxMessage.query.filter(OutboxMessage.id.in_(list(results))):
+        record_outbox_delivery(message, results[message.id])
+    db.session.commit()
+
+def process_outbox():
+    """Envoie les messages en attente sur une seule connexion SMTP ; retourne le nombre envoyé."""
+    import smtplib
+    from flask_mail import Message
+
+    sent = 0
+    batch = claim_outbox_batch()
+    if not batch:
+        return 0
+    try:
+        with get_mail().connect() as connection:
+            while batch:
+                for message in batch:
+                    try:
+                        with timed_outbound('smtp'):
+                            connection.send(
+                                Message(
+                                    subject=message.subject,
+                                    sender=message.sender,
+                                    recipients=message.recipients.split(','),
+                                    body=message.body,
+                                )
+                            )
+                    except (smtplib.SMTPException, OSError) as exc:
+                        record_outbox_delivery(message, exc)
+                    else:
+                        record_outbox_delivery(message)
+                        sent += 1
+                db.session.commit()
+                batch = claim_outbox_batch()
+    except (smtplib.SMTPException, OSError) as exc:
+        # Connexion impossible ou perdue : le reste du lot sera retenté plus tard
+        for message in batch:
+            if message.sent_at is None and message.locked_until is not None:
+                record_outbox_delivery(message, exc)
+        db.session.commit()
+    return sent
+
+def _outbox_worker():
+    while True:
+        OUTBOX_WAKEUP.wait(timeout=OUTBOX_POLL_INTERVAL)
+        OUTBOX_WAKEUP.clear()
+        try:
+            with app.app_context():
+                process_outbox()
+        except Exception:
+            app.logger.exception("Erreur du worker d'envoi des emails")
+
+def start_outbox_worker():
+    """Démarre le worker d'envoi en arrière-plan, une seule fois par processus."""
+    with OUTBOX_LOCK:
+        if OUTBOX_STATE["running"]:
+            return False
+        OUTBOX_STATE["running"] = True
+    threading.Thread(target=_outbox_worker, name="mail-outbox", daemon=True).start()
+    return True
+
+@app.before_request
+def _ensure_outbox_worker():
+    if not OUTBOX_STATE["running"] and app.config['MAIL_USERNAME']:
+        start_outbox_worker()
+
+# Requêtes du catalogue
+PROJECTS_PER_PAGE = 12
+# Clé WSGI posée par export-static : numéro de la page du catalogue en cours d'export
+EXPORT_PAGE_ENVIRON = 'portfolio.export_page'
+FEATURED_PROJECTS_LIMIT = 3
+FEATURED_TESTIMONIALS_LIMIT = 6
+FEATURED_TESTIMONIALS_CACHE = {"generation": None, "expires": 0, "items": []}
+
+def project_listing_query():
+    """Projets du plus récent au plus ancien, sans les colonnes Text lourdes."""
+    return Project.query.options(
+        defer(Project.detailed_description),
+        defer(Project.features),
+    ).order_by(Project.created_at.desc(), Project.id.desc())
+
+def _project_cursor(project):
+    return f"{project.created_at.isoformat()}_{project.id}"
+
+# Identifiant de curseur : entier SQL 64 bits, sinon OverflowError à la liaison du paramètre
+PROJECT_CURSOR_MAX_ID = 2 ** 63 - 1
+
+def _parse_project_cursor(value):
+    """(created_at, id) du curseur `value`, ou None s'il est invalide (retour à la première page)."""
+    try:
+        created_at, project_id = value.rsplit('_', 1)
+        created_at, project_id = datetime.fromisoformat(created_at), int(project_id)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+    if not 1 <= project_id <= PROJECT_CURSOR_MAX_ID:
+        return None
+    return created_at, project_id
+
+# Recherche plein texte (catalogue public et admin), par table indexée
+SEARCH_COLUMNS = {
+    'project': ('name', 'description', 'detailed_description'),
+    'contact': ('name', 'email', 'message'),
+}
+PROJECT_SEARCH_SELECTIVE_LIMIT = 1000
+
+def search_tsvector(table):
+    """Expression tsvector PostgreSQL d'une table, identique à celle de son index GIN."""
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in SEARCH_COLUMNS[table])
+    return f"to_tsvector('simple', {document})"
+
+def ensure_search_index(table, rebuild=False):
+    """Crée l'index plein texte d'une table (FTS5 sous SQLite, GIN sous PostgreSQL) s'il manque."""
+    dialect = db.engine.dialect.name
+    with db.engine.begin() as conn:
+        if dialect == 'postgresql':
+            conn.execute(db.text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table} USING GIN ({search_tsvector(table)})"
+            ))
+            return
+        if dialect != 'sqlite':
+            return
+        columns = ', '.join(SEARCH_COLUMNS[table])
+        new_values = ', '.join(f"new.{column}" for column in SEARCH_COLUMNS[table])
+        old_values = ', '.join(f"old.{column}" for column in SEARCH_COLUMNS[table])
+        try:
+            conn.execute(db.text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5({columns}, "
+                f"content='{table}', content_rowid='id')"
+            ))
+        except OperationalError:
+            app.logger.warning("FTS5 indisponible : la recherche sur %s utilisera LIKE", table)
+            return
+        conn.execute(db.text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {table}_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        ))
+        conn.execute(db.text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {table}_fts({table}_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+        ))
+        conn.execute(db.text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {table}_fts({table}_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {table}_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        ))
+        if rebuild:
+            conn.execute(db.text(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')"))
+
+def ensure_search_indexes(rebuild=False):
+    for table in SEARCH_COLUMNS:
+        ensure_search_index(table, rebuild=rebuild)
+
+SEARCH_BACKEND = {}
+
+def _search_backend(table):
+    """'postgresql', 'fts5' ou 'like' pour une table, déterminé une fois par base."""
+    key = (str(db.engine.url), table)
+    if key not in SEARCH_BACKEND:
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            SEARCH_BACKEND[key] = 'postgresql'
+        elif dialect == 'sqlite' and inspect(db.engine).has_table(f'{table}_fts'):
+            SEARCH_BACKEND[key] = 'fts5'
+        else:
+            SEARCH_BACKEND[key] = 'like'
+    return SEARCH_BACKEND[key]
+
+def full_text_filter(model, terms):
+    """Condition « contient tous les termes » sur les colonnes indexées de `model`."""
+    table = model.__tablename__
+    backend = _search_backend(table)
+    if backend == 'fts5':
+        match = ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        # Terme rare : liste d'ids explicite. Terme courant : EXISTS corrélé, qui
+        # remplit la page en quelques sondes au lieu de matérialiser tous les résultats.
+        sample = db.session.execute(
+            db.text(f"SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH :match LIMIT :limit"),
+            {"match": match, "limit": PROJECT_SEARCH_SELECTIVE_LIMIT + 1},
+        ).scalars().all()
+        if len(sample) <= PROJECT_SEARCH_SELECTIVE_LIMIT:
+            return model.id.in_(sample)
+        return db.text(
+            f"EXISTS (SELECT 1 FROM {table}_fts WHERE {table}_fts MATCH :match "
+            f"AND {table}_fts.rowid = {table}.id)"
+        ).bindparams(match=match)
+    if backend == 'postgresql':
+        return db.text(f"{search_tsvector(table)} @@ plainto_tsquery('simple', :q)").bindparams(q=' '.join(terms))
+    return db.and_(*(
+        db.or_(*(getattr(model, column).ilike(f"%{term}%") for column in SEARCH_COLUMNS[table]))
+        for term in terms
+    ))
+
+def filter_projects(query, stack=None, q=None):
+    """Restreint une requête de projets à une technologie et/ou à une recherche plein texte."""
+    if stack:
+        # EXISTS corrélé : on parcourt le catalogue dans l'ordre et on sonde la clé
+        # primaire (project_id, tag_id), la page se remplit sans matérialiser le tag entier
+        tag_id = db.session.query(Tag.id).filter_by(slug=tag_slug(stack)).scalar()
+        query = query.filter(
+            db.exists().where(project_stack.c.project_id == Project.id, project_stack.c.tag_id == tag_id)
+        )
+    terms = (q or '').split()
+    if terms:
+        query = query.filter(full_text_filter(Project, terms))
+    return query
+
+def paginate_projects(after=None, per_page=PROJECTS_PER_PAGE, stack=None, q=None):
+    """Page du catalogue après le curseur `after` ; retourne (projets, curseur suivant ou None)."""
+    query = filter_projects(project_listing_query(), stack=stack, q=q)
+    cursor = _parse_project_cursor(after)
+    if cursor:
+        created_at, project_id = cursor
+        # Comparaison de tuples : parcours direct de l'index (created_at, id)
+        query = query.filter(db.tuple_(Project.created_at, Project.id) < (created_at, project_id))
+    page = query.limit(per_page + 1).all()
+    if len(page) <= per_page:
+        return page, None
+    page = page[:per_page]
+    return page, _project_cursor(page[-1])
+
+def featured_testimonials():
+    """Témoignages mis en avant, en cache jusqu'à la prochaine invalidation de PAGE_CACHE."""
+    cache = FEATURED_TESTIMONIALS_CACHE
+    if cache["generation"] != PAGE_CACHE.generation or time.monotonic() > cache["expires"]:
+        generation = PAGE_CACHE.generation
+        rows = (
+            Testimonial.query.options(
+                load_only(Testimonial.client_name, Testimonial.company, Testimonial.message, Testimonial.rating)
+            )
+            .order_by(Testimonial.rating.desc(), Testimonial.created_at.desc())
+            .limit(FEATURED_TESTIMONIALS_LIMIT)
+            .all()
+        )
+        cache.update(
+            {
+                "generation": generation,
+                "expires": time.monotonic() + PAGE_CACHE.ttl,
+                "items": [
+                    {
+                        "client_name": row.client_name,
+                        "company": row.company,
+                        "message": row.message,
+                        "rating": row.rating,
+                    }
+                    for row in rows
+                ],
+            }
+        )
+    return cache["items"]
+
 # Routes principales
 @app.route('/')
+@cached_page
 def home():
-    projects = Project.query.limit(3).all()
-    testimonials = Testimonial.query.all()
+    projects = project_listing_query().limit(FEATURED_PROJECTS_LIMIT).all()
+    testimonials = featured_testimonials()
     github_profile, github_repos = fetch_github_assets()
     return render_template(
         'home.html',
@@ -360,37 +2068,55 @@ def home():
     )
 
 @app.route('/about')
+@cached_page
 def about():
     github_profile, github_repos = fetch_github_assets()
     return render_template('about.html', github_profile=github_profile, github_repos=github_repos)
 
 @app.route('/projects')
 def projects():
-    all_projects = Project.query.all()
+    stack = request.args.get('stack', '').strip()
+    q = request.args.get('q', '').strip()
+    page, next_cursor = paginate_projects(request.args.get('after'), stack=stack, q=q)
+    export_page = request.environ.get(EXPORT_PAGE_ENVIRON)
+    if next_cursor is None:
+        next_url = None
+    elif export_page:
+        # Export statique : chemins servables par un simple serveur de fichiers
+        next_url = f"/projects/page/{export_page + 1}/"
+    else:
+        next_url = url_for('projects', after=next_cursor, stack=stack or None, q=q or None)
     github_profile, github_repos = fetch_github_assets(limit=6)
     return render_template(
         'projects.html',
-        projects=all_projects,
+        projects=page,
+        next_url=next_url,
+        static_export=bool(export_page),
+        stack=stack,
+        q=q,
+        stack_tags=Tag.query.order_by(Tag.name).all(),
         github_repos=github_repos,
         github_profile=github_profile
     )
 
 @app.route('/project/<int:project_id>')
 def project_detail(project_id):
-    project = Project.query.get_or_404(project_id)
+    project = Project.query.options(selectinload(Project.feature_list)).get_or_404(project_id)
     return render_template('project_detail.html', project=project)
 
 @app.route('/services')
+@cached_page
 def services():
     return render_template('services.html')
 
 @app.route('/partners')
+@cached_page
 def partners():
     return render_template('partners.html')
 
 @app.route('/contact', methods=['GET', 'POST'])
 def contact():
-    form = ContactForm()
+    form = contact_form_class()()
     if form.validate_on_submit():
         # Sauvegarder le message en base
         contact_msg = Contact(
@@ -399,11 +2125,10 @@ def contact():
             message=form.message.data
         )
         db.session.add(contact_msg)
-        db.session.commit()
-        
-        # Envoyer l'email (optionnel)
-        try:
-            msg = Message(
+
+        # L'email part en file dans la même transaction, envoyé par le worker
+        if app.config['MAIL_USERNAME']:
+            enqueue_mail(
                 subject=f'Nouveau message de {form.name.data}',
                 sender=app.config['MAIL_USERNAME'],
                 recipients=[app.config['MAIL_USERNAME']],
@@ -413,33 +2138,146 @@ def contact():
                 Message: {form.message.data}
                 """
             )
-            mail.send(msg)
-        except:
-            pass  # Continuer même si l'email échoue
-        
+        db.session.commit()
+        OUTBOX_WAKEUP.set()
+
         flash('Votre message a été envoyé avec succès!', 'success')
         return redirect(url_for('contact'))
     
     return render_template('contact.html', form=form)
 
+@app.route('/healthz')
+def healthz():
+    """État de la base et du pool de connexions, pour les sondes et le monitoring."""
+    pool = db.engine.pool
+    pool_stats = {"class": type(pool).__name__}
+    for stat in ('size', 'checkedin', 'checkedout', 'overflow'):
+        if hasattr(pool, stat):
+            pool_stats[stat] = getattr(pool, stat)()
+    try:
+        db.session.execute(db.text('SELECT 1'))
+    except SQLAlchemyError as exc:
+        return jsonify({"status": "error", "database": str(exc), "pool": pool_stats}), 503
+    return jsonify({"status": "ok", "database": db.engine.dialect.name, "pool": pool_stats})
+
+# Préchauffage du worker : /readyz ne répond 200 qu'une fois warm_up() terminé
+# Non défini : déduit de SERVER_NAME / PREFERRED_URL_SCHEME, sinon http://localhost/ (avertissement)
+app.config['WARMUP_BASE_URL'] = os.getenv('WARMUP_BASE_URL')
+WARMUP_STATE = {"ready": False, "running": False, "error": None, "duration_ms": None}
+WARMUP_LOCK = threading.Lock()
+
+def cacheable_pages():
+    """URL des pages servies par @cached_page (routes sans paramètre)."""
+    return sorted(
+        rule.rule
+        for rule in app.url_map.iter_rules()
+        if not rule.arguments and getattr(app.view_functions[rule.endpoint], 'page_cache', False)
+    )
+
+def warmup_base_url():
+    """URL publique sous laquelle les pages sont pré-rendues : PAGE_CACHE a pour clé l'URL complète
+    (schéma et hôte compris), une autre URL ne sert jamais aux visiteurs."""
+    if app.config['WARMUP_BASE_URL']:
+        return app.config['WARMUP_BASE_URL']
+    server_name = app.config.get('SERVER_NAME')
+    if server_name:
+        root = (app.config.get('APPLICATION_ROOT') or '/').rstrip('/')
+        return f"{app.config['PREFERRED_URL_SCHEME']}://{server_name}{root}/"
+    if not (app.debug or app.testing):
+        app.logger.warning(
+            "WARMUP_BASE_URL et SERVER_NAME non définis : pages pré-rendues pour http://localhost/, "
+            "sans effet pour l'hôte public"
+        )
+    return 'http://localhost/'
+
+def _open_db_pool():
+    """Ouvre les connexions permanentes du pool (DB_POOL_SIZE ; QueuePool de 5 pour un fichier SQLite)."""
+    pool = db.engine.pool
+    size = pool.size() if hasattr(pool, 'size') else 1
+    connections = []
+    try:
+        for _ in range(size):
+            connection = db.engine.connect()
+            connection.execute(db.text('SELECT 1'))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+    return size
+
+def warm_up():
+    """Prépare le worker avant son premier visiteur : pool SQL, snapshot GitHub, templates
+    compilés et pages en cache pré-rendues. Retourne True si le worker est prêt.
+
+    Appelé par gunicorn.conf.py (post_worker_init), le lifespan d'asgi.py, à l'import
+    sur Vercel, ou en arrière-plan par le premier appel à /readyz.
+    """
+    with WARMUP_LOCK:
+        if WARMUP_STATE["ready"] or WARMUP_STATE["running"]:
+            return WARMUP_STATE["ready"]
+        WARMUP_STATE["running"] = True
+    start = time.perf_counter()
+    try:
+        with app.app_context():
+            _open_db_pool()
+            try:
+                load_github_snapshot(force=True)
+            except SQLAlchemyError:
+                # Tables github_* absentes : les pages utilisent les constantes de secours
+                db.session.rollback()
+                app.logger.warning("Snapshot GitHub illisible (flask upgrade-db ?)")
+            for name in app.jinja_env.list_templates(extensions=['html']):
+                app.jinja_env.get_template(name)
+        # Corps et variante compressée préférée mis en cache pour l'hôte public
+        client = app.test_client()
+        headers = {'Accept-Encoding': ', '.join(compression_codecs())}
+        base_url = warmup_base_url()
+        for path in cacheable_pages():
+            response = client.get(path, base_url=base_url, headers=headers)
+            response.close()
+            # Le client de test convertit les exceptions des vues en 500 : le worker n'est pas prêt
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} : HTTP {response.status_code}")
+    except Exception as exc:
+        app.logger.exception("Préchauffage du worker impossible")
+        WARMUP_STATE.update({"running": False, "error": str(exc)})
+        return False
+    WARMUP_STATE.update({
+        "ready": True,
+        "running": False,
+        "error": None,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    })
+    return True
+
+@app.route('/readyz')
+def readyz():
+    """Sonde de disponibilité : 503 tant que le worker n'est pas préchauffé."""
+    if not WARMUP_STATE["ready"]:
+        if not WARMUP_STATE["running"]:
+            threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+        return jsonify({"status": "warming", "error": WARMUP_STATE["error"]}), 503
+    return jsonify({"status": "ready", "warmup_ms": WARMUP_STATE["duration_ms"]})
+
 @app.context_processor
 def inject_globals():
-    return {
-        'current_year': datetime.now().year,
-        'portfolio_sites': PORTFOLIO_SITES,
-        'venture_milestones': VENTURE_MILESTONES,
-        'spotlight_projects': SPOTLIGHT_PROJECTS,
-        'partner_network': PARTNER_NETWORK,
-        'workflow_steps': WORKFLOW_STEPS,
-        'github_username': GITHUB_USERNAME
-    }
+    return {'current_year': datetime.now().year}
+
+# Sections constantes des templates rendues une fois au démarrage
+prerender_fragments()
 
 # Initialisation de la base de données
-def init_db():
+def init_db(scale=1):
+    """Recrée la base avec les données de démonstration, répétées `scale` fois (benchmarks)."""
     with app.app_context():
         # Supprimer et recréer toutes les tables
         db.drop_all()
+        if db.engine.dialect.name == 'sqlite':
+            with db.engine.begin() as conn:
+                for table in SEARCH_COLUMNS:
+                    conn.execute(db.text(f"DROP TABLE IF EXISTS {table}_fts"))
         db.create_all()
+        ensure_search_indexes()
         
         # Ajouter des données de démonstration
         sample_projects = [
@@ -495,9 +2333,406 @@ def init_db():
         
         for testimonial in sample_testimonials:
             db.session.add(testimonial)
+
+        # Copies numérotées des données de démonstration, par lots
+        project_fields = ('description', 'github_url', 'stack', 'image_url', 'detailed_description', 'demo_url', 'features')
+        for copy in range(2, scale + 1):
+            for project in sample_projects:
+                db.session.add(Project(
+                    name=f"{project.name} #{copy}",
+                    **{field: getattr(project, field) for field in project_fields}
+                ))
+            for testimonial in sample_testimonials:
+                db.session.add(Testimonial(
+                    client_name=testimonial.client_name,
+                    company=testimonial.company,
+                    message=testimonial.message,
+                    rating=testimonial.rating,
+                ))
+            if copy % 100 == 0:
+                db.session.commit()
         
         db.session.commit()
 
+def upgrade_db():
+    """Crée les tables et index manquants sans supprimer les données existantes.
+
+    Les projets sans tags normalisés sont migrés depuis leurs champs `stack` /
+    `features`, et l'index plein texte est reconstruit.
+    """
+    with app.app_context():
+        db.create_all()
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+
+        # Projets antérieurs à la contrainte NOT NULL : created_at requis par la pagination par curseur
+        Project.query.filter(Project.created_at.is_(None)).update(
+            {Project.created_at: datetime.utcnow()}, synchronize_session=False
+        )
+        db.session.commit()
+
+        last_id = 0
+        while True:
+            batch = (
+                Project.query.options(selectinload(Project.stack_tags), selectinload(Project.feature_list))
+                .filter(Project.id > last_id)
+                .order_by(Project.id)
+                .limit(500)
+                .all()
+            )
+            if not batch:
+                break
+            for project in batch:
+                if not project.stack_tags and not project.feature_list:
+                    sync_project_tags(db.session, project)
+            db.session.commit()
+            last_id = batch[-1].id
+        ensure_search_indexes(rebuild=True)
+
+@app.cli.command('upgrade-db')
+def upgrade_db_command():
+    """Met à niveau le schéma (tables et index) d'une base existante."""
+    upgrade_db()
+    click.echo("Schéma à jour")
+
+# Import / export en masse (JSONL ou CSV), en mémoire constante
+BULK_MODELS = {'projects': Project, 'testimonials': Testimonial, 'contacts': Contact}
+BULK_CHUNK_SIZE = int(os.getenv('BULK_CHUNK_SIZE', 1000))
+
+def _bulk_format(path, fmt=None):
+    if fmt:
+        return fmt
+    return 'csv' if str(path).lower().endswith('.csv') else 'jsonl'
+
+@contextmanager
+def _bulk_open(path, mode):
+    """Ouvre `path` pour l'import/export ; '-' désigne l'entrée ou la sortie standard."""
+    if path == '-':
+        yield sys.stdin if mode == 'r' else sys.stdout
+        return
+    with open(path, mode, encoding='utf-8', newline='') as fp:
+        yield fp
+
+def _bulk_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def export_rows(model, fp, fmt='jsonl'):
+    """Écrit toutes les lignes de `model` dans `fp`, triées par id ; retourne le nombre de lignes.
+
+    Le curseur est lu au fil de l'eau (curseur serveur sous PostgreSQL) :
+    même une grosse table de contacts n'est jamais chargée en mémoire.
+    """
+    table = model.__table__
+    columns = [column.name for column in table.columns]
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(fp)
+        writer.writerow(columns)
+    count = 0
+    with db.engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=BULK_CHUNK_SIZE).execute(
+            db.select(table).order_by(table.c.id)
+        )
+        for row in result:
+            if writer:
+                writer.writerow(['' if value is None else _bulk_value(value) for value in row])
+            else:
+                fp.write(json.dumps(dict(zip(columns, map(_bulk_value, row))), ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+def _read_bulk_rows(fp, fmt):
+    if fmt == 'csv':
+        yield from csv.DictReader(fp)
+        return
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+def _coerce_bulk_row(table, row, line):
+    """Convertit une ligne lue (chaînes CSV, dates ISO) en valeurs de colonnes complètes.
+
+    Les colonnes absentes ou vides prennent leur valeur par défaut ; un id
+    absent laisse la base l'attribuer.
+    """
+    values = {}
+    for column in table.columns:
+        value = row.get(column.name)
+        if value == '' or value is None:
+            if column.primary_key:
+                continue
+            default = column.default
+            value = None
+            if default is not None:
+                value = default.arg(None) if default.is_callable else default.arg
+            if value is None and not column.nullable:
+                raise ValueError(f"ligne {line} : colonne « {column.name} » obligatoire")
+        elif isinstance(column.type, db.Integer):
+            value = int(value)
+        elif isinstance(column.type, db.DateTime) and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        values[column.name] = value
+    return values
+
+def _upsert_statement(table):
+    """INSERT ... ON CONFLICT (id) DO UPDATE, selon le dialecte de la base."""
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise ValueError(f"Import par upsert non pris en charge pour {dialect}")
+    statement = insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={column.name: statement.excluded[column.name] for column in table.columns if not column.primary_key},
+    )
+
+def _import_chunk(model, rows):
+    """Insère / met à jour un lot en deux executemany ; retourne les ids des projets touchés."""
+    table = model.__table__
+    with_id = [row for row in rows if 'id' in row]
+    without_id = [row for row in rows if 'id' not in row]
+    ids = [row['id'] for row in with_id]
+    if with_id:
+        db.session.execute(_upsert_statement(table), with_id)
+    if without_id:
+        if model is Project:
+            # RETURNING en executemany (insertmanyvalues) : ids nécessaires pour les tags
+            ids += db.session.scalars(db.insert(table).returning(table.c.id), without_id).all()
+        else:
+            db.session.execute(db.insert(table), without_id)
+    if model is Project:
+        # Les INSERT Core contournent le hook before_flush : tags et points clés resynchronisés ici
+        projects = Project.query.options(selectinload(Project.stack_tags), selectinload(Project.feature_list))
+        for project in projects.filter(Project.id.in_(ids)):
+            sync_project_tags(db.session, project)
+        db.session.flush()
+        db.session.info.pop('tag_cache', None)
+    db.session.commit()
+    db.session.expunge_all()
+
+def import_rows(model, fp, fmt='jsonl', chunk_size=BULK_CHUNK_SIZE):
+    """Importe les lignes de `fp` par lots (upsert sur l'id) ; retourne le nombre de lignes.
+
+    Restaure un export sans supprimer les tables : les lignes existantes sont
+    mises à jour, les autres insérées.
+    """
+    table = model.__table__
+    rows = (_coerce_bulk_row(table, row, line) for line, row in enumerate(_read_bulk_rows(fp, fmt), start=1))
+    count, explicit_ids = 0, False
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        explicit_ids = explicit_ids or any('id' in row for row in chunk)
+        _import_chunk(model, chunk)
+        count += len(chunk)
+    if explicit_ids and db.engine.dialect.name == 'postgresql':
+        # Séquence recalée après des ids explicites, pour les prochains INSERT
+        db.session.execute(db.text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), COALESCE(MAX(id), 1)) FROM {table.name}"
+        ))
+        db.session.commit()
+    PAGE_CACHE.clear()
+    return count
+
+@app.cli.command('export-data')
+@click.argument('table', type=click.Choice(sorted(BULK_MODELS)))
+@click.argument('path', default='-')
+@click.option('--format', 'fmt', type=click.Choice(['jsonl', 'csv']), help="Déduit de l'extension par défaut.")
+def export_data_command(table, path, fmt):
+    """Exporte une table (projects, testimonials, contacts) en JSONL ou CSV."""
+    with _bulk_open(path, 'w') as fp:
+        count = export_rows(BULK_MODELS[table], fp, _bulk_format(path, fmt))
+    click.echo(f"{count} ligne(s) exportée(s)", err=True)
+
+@app.cli.command('import-data')
+@click.argument('table', type=click.Choice(sorted(BULK_MODELS)))
+@click.argument('path', default='-')
+@click.option('--format', 'fmt', type=click.Choice(['jsonl', 'csv']), help="Déduit de l'extension par défaut.")
+@click.option('--chunk-size', default=BULK_CHUNK_SIZE, show_default=True, help="Lignes par lot (executemany).")
+def import_data_command(table, path, fmt, chunk_size):
+    """Importe (upsert sur l'id) un export JSONL ou CSV, sans supprimer les données existantes."""
+    with _bulk_open(path, 'r') as fp:
+        try:
+            count = import_rows(BULK_MODELS[table], fp, _bulk_format(path, fmt), chunk_size)
+        except (ValueError, SQLAlchemyError) as exc:
+            db.session.rollback()
+            raise click.ClickException(str(exc))
+    click.echo(f"{count} ligne(s) importée(s)")
+
+# Export statique du site
+EXPORT_MANIFEST = '.export-manifest.json'
+
+def _digest(*parts):
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+def _rows_digest(rows, columns):
+    return _digest([[getattr(row, column) for column in columns] for row in rows])
+
+def write_precompressed(path, data):
+    """Écrit `path` accompagné de ses variantes .gz (et .br si brotli est installé)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    path.with_name(path.name + '.gz').write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    try:
+        import brotli
+    except ImportError:
+        return
+    path.with_name(path.name + '.br').write_bytes(brotli.compress(data, quality=11))
+
+def _export_static_assets(output_dir):
+    """Copie static/ dans l'export et y construit les assets ; retourne le manifeste de l'export.
+
+    static/dist n'est pas touché : les workers en cours continuent de servir leurs URLs empreintées.
+    """
+    static_dir = Path(app.static_folder)
+    live = static_dir / ASSET_DIST
+    for source in sorted(static_dir.rglob('*')):
+        if not source.is_file() or live in source.parents:
+            continue
+        target = output_dir / 'static' / source.relative_to(static_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+    return build_assets(output_dir / 'static' / ASSET_DIST)
+
+@contextmanager
+def _rendering_with_assets(manifest):
+    """Rend les pages avec les URLs d'assets de `manifest`, puis rétablit le manifeste servi."""
+    served = dict(ASSET_MANIFEST)
+    ASSET_MANIFEST.clear()
+    ASSET_MANIFEST.update(manifest)
+    PAGE_CACHE.clear()
+    FRAGMENT_CACHE.clear()
+    try:
+        yield
+    finally:
+        ASSET_MANIFEST.clear()
+        ASSET_MANIFEST.update(served)
+        PAGE_CACHE.clear()
+        FRAGMENT_CACHE.clear()
+
+def _export_pages():
+    """Liste (chemin, empreinte des entrées[, URL rendue, page du catalogue]) de chaque page exportable.
+
+    /contact reste dynamique : le formulaire porte un jeton CSRF propre à la session.
+    """
+    template_dir = Path(app.root_path) / app.template_folder
+    common = _digest(
+        [(p.name, p.read_bytes().hex()) for p in sorted(template_dir.glob('*.html'))],
+        PORTFOLIO_SITES, VENTURE_MILESTONES, SPOTLIGHT_PROJECTS, PARTNER_NETWORK, WORKFLOW_STEPS,
+        inject_globals(),
+    )
+    github = _digest(GITHUB_CACHE["profile"], GITHUB_CACHE["repos"])
+    project_columns = [c.name for c in Project.__table__.columns]
+    testimonial_columns = [c.name for c in Testimonial.__table__.columns]
+    all_projects = Project.query.order_by(Project.id).all()
+    projects = _rows_digest(all_projects, project_columns)
+    testimonials = _rows_digest(Testimonial.query.order_by(Testimonial.id).all(), testimonial_columns)
+
+    pages = [
+        ('/', _digest(common, github, projects, testimonials)),
+        ('/about', _digest(common, github)),
+        ('/services', common),
+        ('/partners', common),
+    ]
+    pages.extend(_catalogue_export_pages(all_projects, _digest(common, github, projects)))
+    for project in all_projects:
+        pages.append((f"/project/{project.id}", _digest(common, _rows_digest([project], project_columns))))
+    return pages
+
+def _catalogue_export_pages(all_projects, inputs):
+    """Pages du catalogue : /projects puis /projects/page/<n>/, chacune rendue après le curseur de la précédente."""
+    ordered = sorted(all_projects, key=lambda p: (p.created_at, p.id), reverse=True)
+    pages = [('/projects', inputs, '/projects', 1)]
+    for number, end in enumerate(range(PROJECTS_PER_PAGE, len(ordered), PROJECTS_PER_PAGE), start=2):
+        cursor = _project_cursor(ordered[end - 1])
+        pages.append((f"/projects/page/{number}", inputs, url_for('projects', after=cursor), number))
+    return pages
+
+def export_static_site(output_dir, base_url='http://localhost/', incremental=False):
+    """Pré-rend le site public dans `output_dir` ; retourne la liste des pages réécrites."""
+    output_dir = Path(output_dir)
+    manifest_path = output_dir / EXPORT_MANIFEST
+    previous = {}
+    if incremental and manifest_path.exists():
+        previous = json.loads(manifest_path.read_text())
+
+    with app.app_context():
+        refresh_github_cache()
+    export_assets = _export_static_assets(output_dir)
+    assets = _digest(export_assets)
+
+    written, manifest = [], {}
+    client = app.test_client()
+    with app.test_request_context(base_url=base_url):
+        pages = _export_pages()
+    with _rendering_with_assets(export_assets):
+        for path, inputs, *source in pages:
+            url, export_page = source or (path, None)
+            inputs = _digest(inputs, assets)
+            manifest[path] = inputs
+            target = output_dir / path.strip('/') / 'index.html'
+            if previous.get(path) == inputs and target.exists():
+                continue
+            environ = {EXPORT_PAGE_ENVIRON: export_page} if export_page else None
+            response = client.get(url, base_url=base_url, environ_overrides=environ)
+            if response.status_code != 200:
+                raise RuntimeError(f"Export de {path} impossible : HTTP {response.status_code}")
+            write_precompressed(target, response.get_data())
+            written.append(path)
+
+    # Pages disparues (projets supprimés)
+    for path in set(previous) - set(manifest):
+        page_dir = output_dir / path.strip('/')
+        for variant in ('index.html', 'index.html.gz', 'index.html.br'):
+            (page_dir / variant).unlink(missing_ok=True)
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return written
+
+@app.cli.command('export-static')
+@click.argument('output_dir', default='build')
+@click.option('--base-url', default='http://localhost/', help="URL publique du site (balises og:url).")
+@click.option('--incremental', is_flag=True, help="Ne ré-rend que les pages dont les entrées ont changé.")
+def export_static_command(output_dir, base_url, incremental):
+    """Exporte le site public en HTML statique précompressé."""
+    written = export_static_site(output_dir, base_url=base_url, incremental=incremental)
+    click.echo(f"{len(written)} page(s) exportée(s) dans {output_dir}")
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Compile Tailwind et écrit les assets empreintés et précompressés dans static/dist."""
+    manifest = build_assets()
+    if 'css/site.css' not in manifest:
+        click.echo("CLI Tailwind introuvable (TAILWIND_BIN ou tailwindcss dans le PATH) : le CDN reste utilisé", err=True)
+    click.echo(f"{len(manifest)} asset(s) écrit(s) dans {Path(app.static_folder) / ASSET_DIST}")
+
+@app.cli.command('sync-github')
+@click.option('--force', is_flag=True, help="Synchronise même si la dernière sync date de moins de GITHUB_SYNC_INTERVAL.")
+def sync_github_command(force):
+    """Synchronise le snapshot GitHub (à lancer par cron, ex. toutes les heures)."""
+    changed = sync_github(force=force)
+    if changed is None:
+        click.echo("Snapshot GitHub à jour ou synchronisation déjà en cours")
+    else:
+        click.echo(f"{changed} élément(s) GitHub mis à jour")
+
+@app.cli.command('send-outbox')
+def send_outbox_command():
+    """Envoie les emails en attente (utile là où aucun thread ne tourne, ex. Vercel)."""
+    click.echo(f"{process_outbox()} email(s) envoyé(s)")
+
+# Vercel : chaque instance est préchauffée à l'import, avant sa première requête
+if os.getenv('WARMUP_ON_IMPORT', '1' if os.getenv('VERCEL') else '0') == '1':
+    warm_up()
+
 if __name__ == '__main__':
     init_db()
     app.run(debug=True)
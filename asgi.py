@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée ASGI de l'application Jonathan Kakesa | Cognito Inc.
+
+Les vues Flask (et leurs requêtes SQL) tournent dans un pool de threads borné,
+tandis que les appels GitHub et l'envoi des emails passent par des clients
+asynchrones partagés sur la boucle d'événements : une API GitHub ou un serveur
+SMTP lent n'immobilise plus aucun worker.
+
+    pip install -r requirements-asgi.txt
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 2
+    hypercorn asgi:app --bind 0.0.0.0:5000 --workers 2
+"""
+
+import asyncio
+import os
+from email.message import EmailMessage
+
+import aiosmtplib
+import httpx
+from a2wsgi import WSGIMiddleware
+
+from app import (
+    GITHUB_API_URL,
+    GITHUB_REFRESH_LOCK,
+    GITHUB_REFRESH_STATE,
+    OUTBOX_LOCK,
+    OUTBOX_POLL_INTERVAL,
+    OUTBOX_STATE,
+    OUTBOX_WAKEUP,
+    app as flask_app,
+    apply_github_sync,
+    claim_github_sync,
+    claim_outbox_batch,
+    github_sync_fetch,
+    github_sync_plan,
+    load_github_snapshot,
+    record_outbox_results,
+    timed_outbound,
+    warm_up,
+)
+
+# Threads servant les vues Flask : au plus une connexion SQL chacun (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+ASGI_THREADS = int(os.getenv('ASGI_THREADS', int(os.getenv('DB_POOL_SIZE', 5)) + int(os.getenv('DB_MAX_OVERFLOW', 5))))
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
+wsgi_app = WSGIMiddleware(flask_app, workers=ASGI_THREADS)
+# Clients partagés et tâches de fond, créés au démarrage de la boucle (lifespan)
+RUNTIME = {"http": None, "smtp": None, "tasks": set()}
+
+
+# GitHub
+async def fetch_github_sync(client, plan):
+    """Exécute app.github_sync_fetch() avec httpx, les requêtes de chaque lot en parallèle."""
+
+    async def get(path, headers):
+        try:
+            with timed_outbound('github'):
+                return await client.get(path, headers=headers)
+        except httpx.HTTPError:
+            return None
+
+    steps = github_sync_fetch(plan)
+    batch = next(steps)
+    while True:
+        responses = await asyncio.gather(*(get(path, headers) for path, headers in batch))
+        try:
+            batch = steps.send(list(responses))
+        except StopIteration as stop:
+            return stop.value
+
+def _in_app_context(function, *args):
+    with flask_app.app_context():
+        return function(*args)
+
+def _apply_github_sync(result):
+    with flask_app.app_context():
+        apply_github_sync(result)
+        load_github_snapshot(force=True)
+
+async def refresh_github_cache():
+    """Synchronise le snapshot GitHub : SQL dans le pool de threads, appels à l'API sur la boucle."""
+    try:
+        if await asyncio.to_thread(_in_app_context, claim_github_sync):
+            plan = await asyncio.to_thread(_in_app_context, github_sync_plan)
+            result = await fetch_github_sync(RUNTIME["http"], plan)
+            await asyncio.to_thread(_apply_github_sync, result)
+    except Exception:
+        flask_app.logger.exception("Synchronisation GitHub asynchrone impossible")
+    finally:
+        with GITHUB_REFRESH_LOCK:
+            GITHUB_REFRESH_STATE["running"] = False
+
+def spawn(coroutine):
+    task = asyncio.ensure_future(coroutine)
+    RUNTIME["tasks"].add(task)
+    task.add_done_callback(RUNTIME["tasks"].discard)
+    return task
+
+
+# Emails
+def _claim_outbox_payloads():
+    with flask_app.app_context():
+        return [
+            (message.id, message.subject, message.sender, message.recipients.split(','), message.body)
+            for message in claim_outbox_batch()
+        ]
+
+def _record_outbox_results(results):
+    with flask_app.app_context():
+        record_outbox_results(results)
+
+async def smtp_connection(check=False):
+    """Connexion SMTP partagée ; `check` vérifie (NOOP) qu'elle est encore ouverte, une fois par lot."""
+    smtp = RUNTIME["smtp"]
+    if smtp is not None:
+        if not check:
+            return smtp
+        try:
+            await smtp.noop()
+            return smtp
+        except (aiosmtplib.SMTPException, OSError):
+            RUNTIME["smtp"] = None
+    config = flask_app.config
+    # Comme Flask-Mail : authentification seulement si identifiant et mot de passe sont définis
+    credentials = config['MAIL_USERNAME'] and config['MAIL_PASSWORD']
+    smtp = aiosmtplib.SMTP(
+        hostname=config['MAIL_SERVER'],
+        port=config['MAIL_PORT'],
+        start_tls=config['MAIL_USE_TLS'],
+        username=config['MAIL_USERNAME'] if credentials else None,
+        password=config['MAIL_PASSWORD'] if credentials else None,
+        timeout=10,
+    )
+    await smtp.connect()
+    RUNTIME["smtp"] = smtp
+    return smtp
+
+async def process_outbox():
+    """Équivalent asynchrone de app.process_outbox ; retourne le nombre d'emails envoyés."""
+    sent = 0
+    while True:
+        batch = await asyncio.to_thread(_claim_outbox_payloads)
+        if not batch:
+            return sent
+        results, check = {}, True
+        for message_id, subject, sender, recipients, body in batch:
+            email = EmailMessage()
+            email['Subject'] = subject
+            email['From'] = sender or flask_app.config['MAIL_USERNAME']
+            email['To'] = ', '.join(recipients)
+            email.set_content(body)
+            try:
+                # Coupure en cours de lot : l'échec remet RUNTIME["smtp"] à None, le message suivant reconnecte
+                smtp = await smtp_connection(check)
+                check = False
+                with timed_outbound('smtp'):
+                    await smtp.send_message(email)
+            except (aiosmtplib.SMTPException, OSError) as exc:
+                results[message_id] = exc
+                RUNTIME["smtp"] = None
+            else:
+                results[message_id] = None
+        await asyncio.to_thread(_record_outbox_results, results)
+        sent += sum(error is None for error in results.values())
+
+async def outbox_worker():
+    while True:
+        # Réveillé par POST /contact (thread du pool) ou toutes les OUTBOX_POLL_INTERVAL secondes
+        await asyncio.to_thread(OUTBOX_WAKEUP.wait, OUTBOX_POLL_INTERVAL)
+        OUTBOX_WAKEUP.clear()
+        try:
+            await process_outbox()
+        except Exception:
+            flask_app.logger.exception("Erreur du worker d'envoi des emails")
+
+
+# Cycle de vie
+async def startup():
+    loop = asyncio.get_running_loop()
+    RUNTIME["http"] = httpx.AsyncClient(base_url=GITHUB_API_URL, timeout=5, limits=HTTP_LIMITS)
+    GITHUB_REFRESH_STATE["scheduler"] = lambda: loop.call_soon_threadsafe(spawn, refresh_github_cache())
+    if flask_app.config['MAIL_USERNAME']:
+        with OUTBOX_LOCK:
+            start = not OUTBOX_STATE["running"]
+            OUTBOX_STATE["running"] = True
+        if start:
+            spawn(outbox_worker())
+    # Le serveur n'accepte de connexions qu'après le lifespan : le worker sert à chaud dès sa première requête
+    await asyncio.to_thread(warm_up)
+
+async def shutdown():
+    GITHUB_REFRESH_STATE["scheduler"] = None
+    for task in list(RUNTIME["tasks"]):
+        task.cancel()
+    await asyncio.gather(*RUNTIME["tasks"], return_exceptions=True)
+    # Libère le thread du pool qui attend OUTBOX_WAKEUP
+    OUTBOX_WAKEUP.set()
+    await RUNTIME["http"].aclose()
+    if RUNTIME["smtp"] is not None:
+        try:
+            await RUNTIME["smtp"].quit()
+        except (aiosmtplib.SMTPException, OSError):
+            pass
+
+async def app(scope, receive, send):
+    if scope["type"] != "lifespan":
+        return await wsgi_app(scope, receive, send)
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await startup()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
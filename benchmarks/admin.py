@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark des listes de l'admin sur une grosse table de contacts : latence des
+pages successives, d'une page profonde et d'une recherche, pour les vues de
+create_admin_app() et pour un ModelView Flask-Admin standard (référence).
+
+    python benchmarks/admin.py --contacts 200000 --pages 20 --output admin.json
+
+La base SQLite est créée dans un répertoire temporaire ; aucun appel réseau n'est fait.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def seed_contacts(module, count):
+    origin = datetime(2025, 1, 1)
+    with module.app.app_context():
+        for start in range(0, count, 10000):
+            module.db.session.execute(module.db.insert(module.Contact), [
+                {
+                    "name": f"Contact {i}",
+                    "email": f"contact{i}@example.com",
+                    "message": "Bonjour, " * 60 + ("devis urgent" if i % 500 == 0 else ""),
+                    "created_at": origin + timedelta(minutes=i),
+                }
+                for i in range(start, min(start + 10000, count))
+            ])
+            module.db.session.commit()
+
+
+def plain_admin(module):
+    from flask import Flask
+    from flask_admin import Admin
+    from flask_admin.contrib.sqla import ModelView
+
+    plain = Flask("plain_admin")
+    plain.config.from_mapping(module.app.config)
+    module.db.init_app(plain)
+    class ContactView(ModelView):
+        page_size = module.ADMIN_PAGE_SIZE
+        column_searchable_list = ("name", "email", "message")
+
+    Admin(plain, template_mode="bootstrap4", url="/admin").add_view(ContactView(module.Contact, module.db.session))
+    return plain.test_client()
+
+
+def timed(client, url, sizes):
+    start = time.perf_counter()
+    response = client.get(url)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200, (url, response.status_code)
+    sizes.append(len(response.data))
+    return elapsed
+
+
+def measure(client, pages):
+    sizes = []
+    timed(client, "/admin/contact/", sizes)
+    browse = [timed(client, f"/admin/contact/?page={page}", sizes) for page in range(pages)]
+    return {
+        "pages_successives_p50_ms": round(statistics.median(browse), 2),
+        "page_profonde_ms": round(timed(client, "/admin/contact/?page=2000", sizes), 2),
+        "recherche_ms": round(timed(client, "/admin/contact/?search=urgent", sizes), 2),
+        "octets_par_page": sizes[1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", type=int, default=200000)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/admin.db"
+    os.environ["GITHUB_API_URL"] = "http://127.0.0.1:9"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    module.init_db()
+    seed_contacts(module, args.contacts)
+    report = {
+        "contacts": args.contacts,
+        "ModelView standard": measure(plain_admin(module), args.pages),
+        "create_admin_app()": measure(module.create_admin_app().test_client(), args.pages),
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'import / export en masse (flask import-data / export-data) :
+débit et RSS maximal pour des tables de contacts de tailles croissantes. Un
+RSS stable quand la table grossit confirme le traitement en mémoire constante.
+
+    python benchmarks/bulk_data.py --sizes 10000 100000 --output bulk_data.json
+
+La base SQLite est créée dans un répertoire temporaire ; aucun appel réseau n'est fait.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Lance une commande dans un interpréteur neuf et mesure sa durée et son RSS maximal
+RUN_SNIPPET = """
+import resource, sys, time
+import app
+start = time.perf_counter()
+{call}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+IMPORT_CALL = """
+with app.app.app_context(), open(sys.argv[1], encoding='utf-8', newline='') as fp:
+    app.import_rows(app.Contact, fp, sys.argv[2])
+"""
+
+EXPORT_CALL = """
+with app.app.app_context(), open(sys.argv[1], 'w', encoding='utf-8', newline='') as fp:
+    app.export_rows(app.Contact, fp, sys.argv[2])
+"""
+
+
+def write_contacts(path, count, fmt):
+    with open(path, "w", encoding="utf-8", newline="") as fp:
+        if fmt == "csv":
+            fp.write("name,email,message\n")
+        for i in range(count):
+            row = {"name": f"Contact {i}", "email": f"contact{i}@example.com", "message": "Bonjour " * 20}
+            if fmt == "csv":
+                fp.write(f"{row['name']},{row['email']},{row['message']}\n")
+            else:
+                fp.write(json.dumps(row) + "\n")
+
+
+def run(env, call, path, fmt):
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_SNIPPET.format(call=call), str(path), fmt],
+        cwd=ROOT, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    elapsed, rss = output.split()[-2:]
+    return float(elapsed), int(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    report = {"format": args.format, "contacts": {}}
+    for size in args.sizes:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{tmp}/bulk-{size}.db",
+            GITHUB_API_URL="http://127.0.0.1:9",
+            PYTHONPATH=str(ROOT),
+        )
+        subprocess.run([sys.executable, "-c", "from app import init_db; init_db()"], cwd=ROOT, env=env, check=True)
+        source = tmp / f"contacts-{size}.{args.format}"
+        write_contacts(source, size, args.format)
+        result = {}
+        for label, call, path in (
+            ("import", IMPORT_CALL, source),
+            ("export", EXPORT_CALL, tmp / f"export-{size}.{args.format}"),
+        ):
+            elapsed, rss = run(env, call, path, args.format)
+            result[label] = {"rows_per_s": round(size / elapsed), "peak_rss_kb": rss}
+        report["contacts"][size] = result
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
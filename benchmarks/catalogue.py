@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark du catalogue : latence de /, /projects (première page, page profonde,
+filtres stack / recherche plein texte) et /project/<id> à mesure que la table
+Project grossit.
+
+    python benchmarks/catalogue.py --sizes 1000 100000 --max-ratio 3
+
+La base SQLite est créée dans un répertoire temporaire ; aucun appel réseau n'est fait.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+STACKS = ["Python", "Flask", "PostgreSQL", "React", "Go", "Rust", "Django", "IoT"]
+
+
+def seed_tags(module):
+    module.db.session.execute(
+        module.Tag.__table__.insert(),
+        [{"id": i + 1, "name": name, "slug": name.lower()} for i, name in enumerate(STACKS)],
+    )
+    module.db.session.commit()
+
+
+def seed_projects(module, start, stop):
+    """Insère les projets [start, stop) par lots, avec des colonnes Text volumineuses."""
+    origin = datetime(2015, 1, 1)
+    table = module.Project.__table__
+    for chunk_start in range(start, stop, 5000):
+        rows = [
+            {
+                "name": f"Projet {i}",
+                "description": f"Description courte du projet {i}",
+                "github_url": f"https://github.com/cognito-inc/projet-{i}",
+                "stack": f"{STACKS[i % len(STACKS)]}, {STACKS[(i + 3) % len(STACKS)]}",
+                "image_url": "default-project.jpg",
+                "detailed_description": "Narratif détaillé. " * 200,
+                "features": ", ".join(f"Fonctionnalité {n}" for n in range(30)),
+                "created_at": origin + timedelta(minutes=i),
+            }
+            for i in range(chunk_start, min(chunk_start + 5000, stop))
+        ]
+        module.db.session.execute(table.insert(), rows)
+        module.db.session.execute(
+            module.project_stack.insert(),
+            [
+                {"project_id": i + 1, "tag_id": (i + offset) % len(STACKS) + 1}
+                for i in range(chunk_start, min(chunk_start + 5000, stop))
+                for offset in (0, 3)
+            ],
+        )
+        module.db.session.commit()
+
+
+def time_route(client, module, path, repeat):
+    samples = []
+    for _ in range(repeat):
+        module.PAGE_CACHE.clear()
+        start = time.perf_counter()
+        response = client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, (path, response.status_code)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    parser.add_argument("--max-ratio", type=float, help="Échoue si une route ralentit de plus de ce facteur.")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/catalogue.db"
+    os.environ["GITHUB_API_URL"] = "http://127.0.0.1:9"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    results, seeded = {}, 0
+    with module.app.app_context():
+        module.db.create_all()
+        module.ensure_search_indexes()
+        seed_tags(module)
+        client = module.app.test_client()
+        for size in sorted(args.sizes):
+            seed_projects(module, seeded, size)
+            seeded = size
+            deep = module.project_listing_query().offset(size // 2).first()
+            results[size] = {
+                "/": time_route(client, module, "/", args.repeat),
+                "/projects": time_route(client, module, "/projects", args.repeat),
+                "/projects?after=<milieu>": time_route(
+                    client, module, f"/projects?after={module._project_cursor(deep)}", args.repeat
+                ),
+                "/project/<id>": time_route(client, module, f"/project/{deep.id}", args.repeat),
+                "/projects?stack=rust": time_route(client, module, "/projects?stack=rust", args.repeat),
+                "/projects?q=<nom rare>": time_route(client, module, f"/projects?q=projet+{size // 2}", args.repeat),
+                "/projects?q=<terme courant>&stack=go": time_route(
+                    client, module, "/projects?q=narratif&stack=go", args.repeat
+                ),
+            }
+
+    smallest, largest = results[min(results)], results[max(results)]
+    ratios = {route: largest[route] / smallest[route] for route in smallest}
+    report = {
+        "latency_ms": {str(size): {k: round(v, 2) for k, v in routes.items()} for size, routes in results.items()},
+        "ratio": {route: round(value, 2) for route, value in ratios.items()},
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.max_ratio is not None and max(ratios.values()) > args.max_ratio:
+        print(f"Latence non constante : ratio max {max(ratios.values()):.2f} > {args.max_ratio}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la compression des réponses : octets transférés et temps CPU par
+requête pour chaque encodage (identity, gzip, br, zstd).
+
+Pour les pages en cache (/, /about, ...), « hit » réutilise le corps compressé
+gardé avec l'entrée du cache et « miss » inclut la compression au niveau maximal.
+Les autres routes sont compressées en flux à chaque requête.
+
+    python benchmarks/compression.py --requests 200 --output compression.json
+
+La base SQLite est créée dans un répertoire temporaire ; aucun appel réseau n'est fait.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CACHED_ROUTES = ["/", "/about", "/services", "/partners"]
+DYNAMIC_ROUTES = ["/projects", "/project/1", "/contact", "/static/css/custom.css"]
+
+
+def measure(client, module, path, encoding, requests, clear_cache):
+    headers = {"Accept-Encoding": encoding}
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200, (path, response.status_code)
+    wire = len(response.data)
+    cpu = 0.0
+    for _ in range(requests):
+        if clear_cache:
+            module.PAGE_CACHE.clear()
+        start = time.process_time()
+        client.get(path, headers=headers).close()
+        cpu += time.process_time() - start
+    return {"bytes": wire, "cpu_ms": round(cpu / requests * 1000, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/compression.db"
+    os.environ["GITHUB_API_URL"] = "http://127.0.0.1:9"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    module.init_db()
+    client = module.app.test_client()
+    encodings = ["identity"] + list(module.compression_codecs())
+    report = {"codecs": encodings, "routes": {}}
+    for path in CACHED_ROUTES:
+        report["routes"][path] = {
+            encoding: {
+                "hit": measure(client, module, path, encoding, args.requests, clear_cache=False),
+                "miss": measure(client, module, path, encoding, args.requests // 4 or 1, clear_cache=True),
+            }
+            for encoding in encodings
+        }
+    for path in DYNAMIC_ROUTES:
+        report["routes"][path] = {
+            encoding: measure(client, module, path, encoding, args.requests, clear_cache=False)
+            for encoding in encodings
+        }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
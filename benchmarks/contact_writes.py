@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test de charge en écriture : de nombreux threads postent le formulaire de contact
+en parallèle sur une base SQLite fichier.
+
+    python benchmarks/contact_writes.py --threads 32 --posts 50
+    SQLITE_JOURNAL_MODE=DELETE SQLITE_BUSY_TIMEOUT_MS=0 python benchmarks/contact_writes.py
+
+Rapporte le débit, les latences et le nombre d'erreurs (dont « database is locked »).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--posts", type=int, default=50, help="Nombre de POST par thread.")
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/contact.db"
+    os.environ["GITHUB_API_URL"] = "http://127.0.0.1:9"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    module.app.config["WTF_CSRF_ENABLED"] = False
+    with module.app.app_context():
+        module.db.create_all()
+
+    latencies, errors = [], []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(args.threads)
+
+    def writer(worker):
+        client = module.app.test_client()
+        start_barrier.wait()
+        for n in range(args.posts):
+            data = {"name": f"Charge {worker}", "email": f"charge{worker}@example.com", "message": f"Message {n}"}
+            started = time.perf_counter()
+            try:
+                response = client.post("/contact", data=data)
+                error = None if response.status_code == 302 else f"HTTP {response.status_code}"
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed)
+                if error:
+                    errors.append(error)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    with module.app.app_context():
+        stored = module.Contact.query.count()
+
+    latencies.sort()
+    report = {
+        "threads": args.threads,
+        "posts": args.threads * args.posts,
+        "stored": stored,
+        "errors": len(errors),
+        "locked_errors": sum("locked" in error for error in errors),
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies), 2),
+            "p95": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+            "max": round(latencies[-1], 2),
+        },
+        "sample_errors": sorted(set(errors))[:5],
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
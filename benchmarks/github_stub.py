@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Serveur local imitant l'API GitHub (profil, dépôts paginés, langages, ETag / 304).
+
+Utilisé par les benchmarks pour ne jamais dépendre du réseau ni du quota GitHub :
+
+    python benchmarks/github_stub.py --port 8081 --repos 150 --delay 0.2
+    GITHUB_API_URL=http://127.0.0.1:8081 gunicorn app:app
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+LANGUAGES = ["Python", "JavaScript", "C++", "HTML", "Go", None]
+TOPICS = ["flask", "iot", "ai", "robotics", "education"]
+
+
+def make_repos(count, login="JonathanK-N"):
+    origin = datetime(2024, 1, 1)
+    return [
+        {
+            "id": i + 1,
+            "name": f"repo-{i:04d}",
+            "full_name": f"{login}/repo-{i:04d}",
+            "description": f"Dépôt de démonstration {i}",
+            "html_url": f"https://github.com/{login}/repo-{i:04d}",
+            "language": LANGUAGES[i % len(LANGUAGES)],
+            "topics": [TOPICS[i % len(TOPICS)], TOPICS[(i + 2) % len(TOPICS)]],
+            "stargazers_count": (i * 7) % 50,
+            "forks_count": i % 5,
+            "pushed_at": (origin + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "updated_at": (origin + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        for i in range(count)
+    ]
+
+
+class GitHubStub:
+    """État partagé du serveur : données servies, délai artificiel et journal des appels."""
+
+    def __init__(self, repos=12, delay=0.0, login="JonathanK-N"):
+        self.login = login
+        self.delay = delay
+        self.repos = make_repos(repos, login) if isinstance(repos, int) else repos
+        self.profile = {
+            "login": login,
+            "name": "Jonathan Kakesa",
+            "followers": 18,
+            "public_repos": len(self.repos),
+            "public_gists": 1,
+            "html_url": f"https://github.com/{login}",
+            "blog": "https://cognito-inc.ca/",
+        }
+        self.hits = []
+        self.server = None
+
+    def push(self, index=0):
+        """Simule un push sur un dépôt : pushed_at avancé et une étoile de plus."""
+        repo = self.repos[index]
+        repo["pushed_at"] = repo["updated_at"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        repo["stargazers_count"] += 1
+        return repo
+
+    def payload(self, path, query):
+        if path == f"/users/{self.login}":
+            return self.profile
+        if path == f"/users/{self.login}/repos":
+            per_page = int(query.get("per_page", 30))
+            page = int(query.get("page", 1))
+            return self.repos[(page - 1) * per_page: page * per_page]
+        if path.startswith(f"/repos/{self.login}/") and path.endswith("/languages"):
+            name = path.split("/")[3]
+            repo = next((r for r in self.repos if r["name"] == name), None)
+            return {repo["language"]: 1000} if repo and repo["language"] else {}
+        return None
+
+    def start(self, host="127.0.0.1", port=0):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                stub.hits.append((self.path, self.headers.get("If-None-Match")))
+                if stub.delay:
+                    time.sleep(stub.delay)
+                data = stub.payload(url.path, dict(parse_qsl(url.query)))
+                if data is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(data).encode()
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self.server.server_port}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--repos", type=int, default=12)
+    parser.add_argument("--delay", type=float, default=0.0, help="Latence artificielle par appel (s).")
+    args = parser.parse_args()
+    stub = GitHubStub(repos=args.repos, delay=args.delay)
+    print(f"API GitHub factice sur {stub.start(port=args.port)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
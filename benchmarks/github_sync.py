@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la synchronisation GitHub (flask sync-github) : appels à l'API,
+réponses 304 et durée pour une première sync, une sync sans changement et une
+sync après un push sur un seul dépôt, puis latence de lecture du snapshot.
+
+    python benchmarks/github_sync.py --repos 150 --delay 0.05 --output github_sync.json
+
+La base SQLite est créée dans un répertoire temporaire ; l'API GitHub est
+remplacée par benchmarks/github_stub.py.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from github_stub import GitHubStub  # noqa: E402
+
+
+def run_sync(module, stub):
+    hits = len(stub.hits)
+    start = time.perf_counter()
+    with module.app.app_context():
+        changed = module.sync_github(force=True)
+    duration = time.perf_counter() - start
+    calls = stub.hits[hits:]
+    return {
+        "changed": changed,
+        "api_calls": len(calls),
+        "conditional_calls": sum(1 for _, etag in calls if etag),
+        "languages_calls": sum(1 for path, _ in calls if path.endswith("/languages")),
+        "duration_ms": round(duration * 1000, 1),
+    }
+
+
+def read_samples(module, reads):
+    samples = []
+    with module.app.test_request_context("/"):
+        for _ in range(reads):
+            start = time.perf_counter()
+            module.fetch_github_assets(limit=6)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=150)
+    parser.add_argument("--delay", type=float, default=0.05, help="Latence simulée de l'API GitHub (s).")
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    stub = GitHubStub(repos=args.repos, delay=args.delay)
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/github_sync.db"
+    os.environ["GITHUB_API_URL"] = stub.start()
+    os.environ["GITHUB_SYNC_INTERVAL"] = "0"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    module.init_db()
+    try:
+        report = {"repos": args.repos, "syncs": {}}
+        report["syncs"]["première sync"] = run_sync(module, stub)
+        report["syncs"]["sans changement"] = run_sync(module, stub)
+        stub.push(0)
+        report["syncs"]["un dépôt poussé"] = run_sync(module, stub)
+        report["lecture du snapshot"] = read_samples(module, args.reads)
+    finally:
+        stub.stop()
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Banc de charge reproductible pour toutes les routes publiques.
+
+Démarre l'application (serveur Werkzeug threadé, gunicorn ou uvicorn via asgi.py) sur une base SQLite
+temporaire peuplée par init_db(scale=N), avec l'API GitHub remplacée par
+benchmarks/github_stub.py, puis charge chaque route avec C clients concurrents.
+
+    python benchmarks/routes.py --scale 50 --concurrency 8 --requests 400 --output baseline.json
+    python benchmarks/routes.py --compare baseline.json --tolerance 0.25
+    python benchmarks/routes.py --server gunicorn --workers 2 --output sync.json
+    python benchmarks/routes.py --server uvicorn --workers 1 --output async.json
+
+Rapporte par route : latences p50/p95/p99, débit, erreurs et pic de RSS du serveur
+(Linux : /proc). En mode comparaison, sort en erreur si une route régresse.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from github_stub import GitHubStub  # noqa: E402
+
+ROUTES = [
+    ("GET", "/"),
+    ("GET", "/about"),
+    ("GET", "/projects"),
+    ("GET", "/project/1"),
+    ("GET", "/services"),
+    ("GET", "/partners"),
+    ("GET", "/contact"),
+    ("POST", "/contact"),
+]
+CSRF_RE = re.compile(r'name="csrf_token" type="hidden" value="([^"]+)"')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_tree(pid):
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        for task in Path(f"/proc/{current}/task").glob("*"):
+            try:
+                pending.extend(int(child) for child in (task / "children").read_text().split())
+            except OSError:
+                pass
+    return pids
+
+
+def reset_peak_rss(pid):
+    for child in process_tree(pid):
+        try:
+            Path(f"/proc/{child}/clear_refs").write_text("5")
+        except OSError:
+            pass
+
+
+def peak_rss_kb(pid):
+    """Somme des pics de RSS (VmHWM) du serveur et de ses workers, None hors Linux."""
+    total = 0
+    for child in process_tree(pid):
+        try:
+            status = Path(f"/proc/{child}/status").read_text()
+        except OSError:
+            continue
+        match = re.search(r"VmHWM:\s+(\d+)", status)
+        total += int(match.group(1)) if match else 0
+    return total or None
+
+
+class Client:
+    """Connexion HTTP keep-alive avec gestion minimale du cookie de session."""
+
+    def __init__(self, port):
+        self.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        self.cookie = None
+
+    def request(self, method, path, body=None):
+        headers = {"Cookie": self.cookie} if self.cookie else {}
+        if body is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        self.conn.request(method, path, body=body, headers=headers)
+        response = self.conn.getresponse()
+        data = response.read()
+        cookie = response.getheader("Set-Cookie")
+        if cookie:
+            self.cookie = cookie.split(";", 1)[0]
+        return response.status, data
+
+    def contact_payload(self, n):
+        status, html = self.request("GET", "/contact")
+        token = CSRF_RE.search(html.decode()).group(1)
+        return urlencode({
+            "csrf_token": token,
+            "name": f"Banc {n}",
+            "email": f"banc{n}@example.com",
+            "message": "Message de charge",
+        })
+
+
+def load_route(port, method, path, concurrency, total):
+    """Envoie `total` requêtes réparties sur `concurrency` clients ; retourne latences et erreurs."""
+    latencies, errors = [], []
+    lock = threading.Lock()
+    per_client = max(1, total // concurrency)
+    expected = 302 if method == "POST" else 200
+
+    def run(worker):
+        client = Client(port)
+        body = client.contact_payload(worker) if method == "POST" else None
+        local = []
+        for _ in range(per_client):
+            start = time.perf_counter()
+            try:
+                status, _ = client.request(method, path, body)
+            except (OSError, http.client.HTTPException) as exc:
+                status = type(exc).__name__
+                client = Client(port)
+            local.append((time.perf_counter() - start) * 1000)
+            if status != expected:
+                with lock:
+                    errors.append(str(status))
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(run, range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def start_server(args, env, port):
+    if args.server == "gunicorn":
+        command = [
+            sys.executable, "-m", "gunicorn", "app:app",
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ] + list(args.server_arg)
+    elif args.server == "uvicorn":
+        command = [
+            sys.executable, "-m", "uvicorn", "asgi:app",
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ] + list(args.server_arg)
+    else:
+        command = [
+            sys.executable, "-c",
+            "from werkzeug.serving import run_simple; from app import app; "
+            f"run_simple('127.0.0.1', {port}, app, threaded=True)",
+        ]
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/healthz")
+            if conn.getresponse().status == 200:
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("Le serveur n'a pas démarré")
+
+
+def compare(report, baseline, tolerance):
+    """Liste les régressions (p95 plus lent ou débit plus faible au-delà de la tolérance)."""
+    regressions = []
+    for route, current in report["routes"].items():
+        previous = baseline["routes"].get(route)
+        if not previous:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{route} : p95 {previous['p95_ms']} -> {current['p95_ms']} ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{route} : débit {previous['throughput_rps']} -> {current['throughput_rps']} req/s"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="Répétitions des données de init_db().")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=400, help="Requêtes par route.")
+    parser.add_argument("--routes", nargs="*", help="Sous-ensemble, ex. 'GET /' 'POST /contact'.")
+    parser.add_argument("--server", choices=("werkzeug", "gunicorn", "uvicorn"), default="werkzeug")
+    parser.add_argument("--workers", type=int, default=2, help="Processus gunicorn / uvicorn.")
+    parser.add_argument("--server-arg", action="append", default=[], help="Argument gunicorn / uvicorn supplémentaire.")
+    parser.add_argument("--github-delay", type=float, default=0.0, help="Latence simulée de l'API GitHub (s).")
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    parser.add_argument("--compare", help="Rapport de référence à comparer.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    routes = [tuple(r.split(" ", 1)) for r in args.routes] if args.routes else ROUTES
+    stub = GitHubStub(repos=40, delay=args.github_delay)
+    tmp = tempfile.mkdtemp()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+        GITHUB_API_URL=stub.start(),
+        PYTHONPATH=str(ROOT),
+    )
+    env.pop("MAIL_USERNAME", None)
+    subprocess.run(
+        [sys.executable, "-c", f"from app import init_db; init_db(scale={args.scale})"],
+        cwd=ROOT, env=env, check=True,
+    )
+    # Snapshot GitHub rempli avant le démarrage, comme avec le cron de production
+    subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "app", "sync-github"],
+        cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL,
+    )
+
+    port = free_port()
+    server = start_server(args, env, port)
+    try:
+        # Chauffe : snapshot GitHub, cache de pages et compilation des templates
+        warm = Client(port)
+        for _ in range(3):
+            for method, path in routes:
+                if method == "GET":
+                    warm.request(method, path)
+            time.sleep(0.2)
+
+        results = {}
+        for method, path in routes:
+            reset_peak_rss(server.pid)
+            latencies, errors, duration = load_route(port, method, path, args.concurrency, args.requests)
+            results[f"{method} {path}"] = {
+                "requests": len(latencies),
+                "errors": len(errors),
+                "p50_ms": round(statistics.median(latencies), 2),
+                "p95_ms": round(percentile(latencies, 0.95), 2),
+                "p99_ms": round(percentile(latencies, 0.99), 2),
+                "throughput_rps": round(len(latencies) / duration, 1),
+                "peak_rss_kb": peak_rss_kb(server.pid),
+            }
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        stub.stop()
+
+    report = {
+        "meta": {
+            "scale": args.scale,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "server": args.server,
+            "workers": args.workers if args.server != "werkzeug" else 1,
+            "python": sys.version.split()[0],
+        },
+        "routes": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    status = 1 if any(r["errors"] for r in results.values()) else 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("meta") != report["meta"]:
+            print("Attention : paramètres différents de la référence", baseline.get("meta"), file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"RÉGRESSION {line}", file=sys.stderr)
+        status = status or (1 if regressions else 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark de démarrage à froid : temps d'import de app.py, premier octet et RSS.
+Avec --warm-up, app.warm_up() tourne entre l'import et la première requête, comme
+dans un worker gunicorn (gunicorn.conf.py).
+
+Chaque mesure tourne dans un interpréteur neuf lancé avec `python -X importtime`.
+Le rapport JSON (médianes + modules les plus coûteux) est pensé pour la CI :
+
+    python benchmarks/startup.py --runs 5 --output startup.json --max-import-ms 600
+    python benchmarks/startup.py --runs 5 --warm-up
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import app as module
+imported = time.perf_counter()
+if {warm_up!r}:
+    module.warm_up()
+warmed = time.perf_counter()
+response = module.app.test_client().get({path!r})
+first_byte = time.perf_counter()
+print(json.dumps({{
+    "status": response.status_code,
+    "import_ms": (imported - start) * 1000,
+    "warmup_ms": (warmed - imported) * 1000,
+    "first_request_ms": (first_byte - warmed) * 1000,
+    "ttfb_ms": (first_byte - start) * 1000,
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Retourne {module de premier niveau: temps cumulé en ms} depuis la sortie -X importtime."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        head, _cumulative, name = line.split("|")
+        self_us = int(head.split(":")[1])
+        top_level = name.strip().split(".")[0]
+        modules[top_level] = modules.get(top_level, 0) + self_us / 1000
+    return modules
+
+
+def run_once(path, env, warm_up=False):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD.format(root=str(ROOT), path=path, warm_up=warm_up)],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=True,
+    )
+    sample = json.loads(result.stdout.strip().splitlines()[-1])
+    sample["modules"] = parse_importtime(result.stderr)
+    return sample
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/services", help="Route demandée après l'import.")
+    parser.add_argument("--warm-up", action="store_true", help="Préchauffe (app.warm_up) avant la première requête.")
+    parser.add_argument("--top", type=int, default=10, help="Nombre de modules à détailler.")
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    parser.add_argument("--max-import-ms", type=float, help="Échoue si la médiane d'import dépasse ce seuil.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env.setdefault("DATABASE_URL", f"sqlite:///{tmp}/startup.db")
+        # Pas d'appel réseau pendant la mesure
+        env.setdefault("GITHUB_API_URL", "http://127.0.0.1:9")
+        samples = [run_once(args.path, env, args.warm_up) for _ in range(args.runs)]
+
+    modules = {}
+    for sample in samples:
+        for name, ms in sample["modules"].items():
+            modules.setdefault(name, []).append(ms)
+    report = {
+        "runs": args.runs,
+        "path": args.path,
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "warm_up": args.warm_up,
+        "warmup_ms": statistics.median(s["warmup_ms"] for s in samples),
+        "first_request_ms": statistics.median(s["first_request_ms"] for s in samples),
+        "ttfb_ms": statistics.median(s["ttfb_ms"] for s in samples),
+        "maxrss_kb": statistics.median(s["maxrss_kb"] for s in samples),
+        "top_modules_ms": dict(
+            sorted(
+                ((name, round(statistics.median(values), 2)) for name, values in modules.items()),
+                key=lambda item: item[1],
+                reverse=True,
+            )[: args.top]
+        ),
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.max_import_ms is not None and report["import_ms"] > args.max_import_ms:
+        print(f"Import trop lent : {report['import_ms']:.0f} ms > {args.max_import_ms:.0f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark du rendu Jinja : temps de rendu de home.html par requête avec et sans
+cache de fragments ({% cache %}), et compilation des templates au démarrage d'un
+worker avec et sans cache de bytecode.
+
+    python benchmarks/templates.py --renders 2000 --output templates.json
+
+La base SQLite est créée dans un répertoire temporaire ; aucun appel réseau n'est fait.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Compile tous les templates dans un interpréteur neuf, comme au boot d'un worker
+COMPILE_SNIPPET = """
+import time, app
+env = app.app.jinja_env
+env.cache.clear()
+start = time.perf_counter()
+for name in env.list_templates(extensions=['html']):
+    env.get_template(name)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def render_samples(module, renders):
+    from flask import render_template
+
+    with module.app.test_request_context("/"):
+        context = {
+            "projects": module.project_listing_query().limit(module.FEATURED_PROJECTS_LIMIT).all(),
+            "testimonials": module.featured_testimonials(),
+        }
+        context["github_profile"], context["github_repos"] = module.fetch_github_assets()
+        for _ in range(50):
+            render_template("home.html", **context)
+        samples = []
+        for _ in range(renders):
+            start = time.perf_counter()
+            render_template("home.html", **context)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+def compile_ms(env, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", COMPILE_SNIPPET], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return round(statistics.median(samples), 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=2000)
+    parser.add_argument("--boots", type=int, default=5, help="Interpréteurs lancés pour mesurer la compilation.")
+    parser.add_argument("--output", help="Fichier JSON de sortie (stdout par défaut).")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/templates.db"
+    os.environ["GITHUB_API_URL"] = "http://127.0.0.1:9"
+    os.environ["JINJA_BYTECODE_CACHE_DIR"] = f"{tmp}/jinja"
+    sys.path.insert(0, str(ROOT))
+    import app as module
+
+    module.init_db()
+    report = {"home.html": {}, "compilation_ms": {}}
+    for enabled in (False, True):
+        module.app.config["FRAGMENT_CACHE_ENABLED"] = enabled
+        module.FRAGMENT_CACHE.clear()
+        label = "avec cache de fragments" if enabled else "sans cache de fragments"
+        report["home.html"][label] = render_samples(module, args.renders)
+
+    env = dict(os.environ, JINJA_BYTECODE_CACHE_DIR="")
+    report["compilation_ms"]["sans cache de bytecode"] = compile_ms(env, args.boots)
+    env["JINJA_BYTECODE_CACHE_DIR"] = f"{tmp}/jinja"
+    compile_ms(env, 1)  # remplit le cache
+    report["compilation_ms"]["avec cache de bytecode"] = compile_ms(env, args.boots)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
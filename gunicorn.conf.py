@@ -0,0 +1,12 @@
+"""
+Configuration gunicorn de l'application Jonathan Kakesa | Cognito Inc.
+
+Chargée automatiquement par `gunicorn app:app` depuis la racine du projet.
+"""
+
+
+def post_worker_init(worker):
+    """Préchauffe le worker (app.warm_up) une fois l'application chargée, avant sa première connexion."""
+    from app import warm_up
+
+    warm_up()
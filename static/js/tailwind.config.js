@@ -0,0 +1,28 @@
+// Thème Tailwind partagé entre la CLI (flask build-assets) et le CDN de développement (base.html)
+const cognitoTailwindConfig = {
+    darkMode: 'class',
+    content: ['./templates/**/*.html', './static/js/**/*.js'],
+    theme: {
+        extend: {
+            fontFamily: {
+                grotesk: ['Space Grotesk', 'sans-serif']
+            },
+            colors: {
+                midnight: '#050B16',
+                abyss: '#05192F',
+                aurora: '#00D4FF',
+                plasma: '#4BF2C3',
+                slate: '#7D8DA6'
+            },
+            boxShadow: {
+                'glow': '0 0 60px rgba(0, 212, 255, 0.15)'
+            }
+        }
+    }
+};
+
+if (typeof module !== 'undefined') {
+    module.exports = cognitoTailwindConfig;
+} else {
+    tailwind.config = cognitoTailwindConfig;
+}
@@ -0,0 +1,114 @@
+"""
+Fixtures communes : base SQLite temporaire, API GitHub remplacée par
+benchmarks/github_stub.py et serveur SMTP local (aiosmtpd). L'environnement est fixé avant l'import de app.py,
+qui lit sa configuration à l'import.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from github_stub import GitHubStub, make_repos  # noqa: E402
+
+STUB = GitHubStub(repos=12)
+SMTP_DELAY = 0.5
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/tests.db"
+os.environ["GITHUB_API_URL"] = STUB.start()
+os.environ["JINJA_BYTECODE_CACHE_DIR"] = ""
+os.environ.pop("MAIL_USERNAME", None)
+
+import app as app_module  # noqa: E402
+
+
+def wait_for_github_refresh(module, timeout=10):
+    """Attend la fin de la sync GitHub lancée en arrière-plan."""
+    deadline = time.monotonic() + timeout
+    while module.GITHUB_REFRESH_STATE["running"]:
+        assert time.monotonic() < deadline, "sync GitHub en arrière-plan non terminée"
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def stub():
+    STUB.repos = make_repos(12, STUB.login)
+    STUB.profile["public_repos"] = len(STUB.repos)
+    STUB.delay = 0.0
+    STUB.hits.clear()
+    return STUB
+
+
+@pytest.fixture
+def module(stub):
+    """app.py sur une base neuve, caches et snapshot GitHub vidés."""
+    module = app_module
+    module.app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    module.init_db()
+    module.PAGE_CACHE.clear()
+    module.GITHUB_CACHE.update(
+        {"profile": None, "repos": [], "repos_by_language": {}, "repos_by_topic": {}, "timestamp": None}
+    )
+    module.GITHUB_SNAPSHOT.update({"checked": float("-inf"), "version": None})
+    yield module
+    wait_for_github_refresh(module)
+
+
+@pytest.fixture
+def client(module):
+    return module.app.test_client()
+
+
+class SlowHandler:
+    """Serveur SMTP local qui met SMTP_DELAY secondes à accepter chaque message."""
+
+    def __init__(self):
+        self.messages = []
+        self.peers = set()
+        self.noops = 0
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(SMTP_DELAY)
+        self.messages.append(envelope.content)
+        self.peers.add(session.peer)
+        return "250 OK"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp(module, monkeypatch):
+    from aiosmtpd.controller import Controller
+
+    handler = SlowHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    monkeypatch.setitem(module.app.config, "MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setitem(module.app.config, "MAIL_PORT", controller.port)
+    monkeypatch.setitem(module.app.config, "MAIL_USE_TLS", False)
+    monkeypatch.setitem(module.app.config, "MAIL_USERNAME", "site@example.com")
+    monkeypatch.setitem(module.app.config, "MAIL_PASSWORD", None)
+    # Flask-Mail n'envoie rien quand TESTING est actif, sauf demande explicite
+    monkeypatch.setitem(module.app.config, "MAIL_SUPPRESS_SEND", False)
+    # Pas de worker en arrière-plan : le test appelle process_outbox() lui-même
+    monkeypatch.setitem(module.OUTBOX_STATE, "running", True)
+    module.app.extensions.pop("mail", None)
+    yield handler
+    module.app.extensions.pop("mail", None)
+    controller.stop()
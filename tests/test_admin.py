@@ -0,0 +1,56 @@
+"""create_admin_app() : l'admin partage le moteur (et le pool) de l'application principale."""
+
+from sqlalchemy import event
+
+
+def test_admin_app_shares_engine(module):
+    admin_app = module.create_admin_app()
+    with module.app.app_context():
+        engine = module.db.engine
+    with admin_app.app_context():
+        assert module.db.engine is engine
+
+
+def test_admin_list_uses_main_pool(module):
+    with module.app.app_context():
+        pool = module.db.engine.pool
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(pool, "checkout", on_checkout)
+    try:
+        response = module.create_admin_app().test_client().get("/admin/project/")
+    finally:
+        event.remove(pool, "checkout", on_checkout)
+    assert response.status_code == 200
+    assert checkouts
+
+
+def test_admin_create_project_with_blank_date(module):
+    client = module.create_admin_app().test_client()
+    response = client.post(
+        "/admin/project/new/",
+        data={"name": "Projet admin", "description": "d", "github_url": "https://github.com/x",
+              "stack": "Flask", "created_at": ""},
+    )
+    assert response.status_code == 302
+    with module.app.app_context():
+        project = module.Project.query.filter_by(name="Projet admin").one()
+        created_at = project.created_at
+        assert created_at is not None
+
+    # En édition, une date vide conserve la date existante
+    response = client.post(
+        f"/admin/project/edit/?id={project.id}",
+        data={"name": "Projet admin", "description": "modifié", "github_url": "https://github.com/x",
+              "stack": "Flask", "created_at": ""},
+    )
+    assert response.status_code == 302
+    with module.app.app_context():
+        project = module.db.session.get(module.Project, project.id)
+        assert project.description == "modifié"
+        assert project.created_at == created_at
+        module.db.session.delete(project)
+        module.db.session.commit()
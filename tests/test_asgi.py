@@ -0,0 +1,80 @@
+"""asgi.py : même sync GitHub que app.sync_github() (httpx) et même file d'emails (aiosmtplib)."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("aiosmtplib")
+pytest.importorskip("a2wsgi")
+
+import httpx  # noqa: E402
+
+import asgi  # noqa: E402
+
+
+def async_fetch(module, plan):
+    async def run():
+        async with httpx.AsyncClient(base_url=module.GITHUB_API_URL, timeout=5) as client:
+            return await asgi.fetch_github_sync(client, plan)
+
+    return asyncio.run(run())
+
+
+def test_async_fetch_matches_sync_fetch(module, stub):
+    with module.app.app_context():
+        module.sync_github(force=True)
+        stub.push(2)
+        plan = module.github_sync_plan()
+    expected = module._fetch_github_sync(module.get_http_session(), plan)
+    stub.hits.clear()
+    result = async_fetch(module, plan)
+
+    assert result == expected
+    assert list(result["languages"]) == ["repo-0002"]
+    assert all(etag for path, etag in stub.hits if not path.endswith("/languages"))
+
+
+def test_async_outbox_records_deliveries(module, smtp):
+    with module.app.app_context():
+        for i in range(2):
+            module.enqueue_mail("Nouveau message", ["site@example.com"], f"Message {i}")
+        module.db.session.commit()
+
+    async def run():
+        try:
+            return await asgi.process_outbox()
+        finally:
+            if asgi.RUNTIME["smtp"] is not None:
+                await asgi.RUNTIME["smtp"].quit()
+            asgi.RUNTIME["smtp"] = None
+
+    assert asyncio.run(run()) == 2
+    assert len(smtp.messages) == 2
+    assert len(smtp.peers) == 1
+    with module.app.app_context():
+        assert module.OutboxMessage.query.filter(module.OutboxMessage.sent_at.is_(None)).count() == 0
+
+
+def test_async_outbox_checks_connection_once_per_batch(module, smtp):
+    def enqueue(count):
+        with module.app.app_context():
+            for i in range(count):
+                module.enqueue_mail("Nouveau message", ["site@example.com"], f"Message {i}")
+            module.db.session.commit()
+
+    async def run():
+        try:
+            enqueue(1)
+            first = await asgi.process_outbox()
+            enqueue(3)
+            return first + await asgi.process_outbox()
+        finally:
+            if asgi.RUNTIME["smtp"] is not None:
+                await asgi.RUNTIME["smtp"].quit()
+            asgi.RUNTIME["smtp"] = None
+
+    assert asyncio.run(run()) == 4
+    # Un seul NOOP, au début du second lot, réutilisant la connexion du premier
+    assert smtp.noops == 1
+    assert len(smtp.peers) == 1
@@ -0,0 +1,53 @@
+"""/projects : pagination par curseur (created_at, id) ; un curseur invalide renvoie la première page."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def catalogue(module):
+    with module.app.app_context():
+        for project in module.Project.query:
+            module.db.session.delete(project)
+        module.db.session.add_all(
+            module.Project(
+                name=f"Projet {i}", description="d", github_url="https://github.com/x", stack="Flask",
+                created_at=datetime(2024, 1, 1) + timedelta(days=i % 3),
+            )
+            for i in range(module.PROJECTS_PER_PAGE + 5)
+        )
+        module.db.session.commit()
+    yield
+    with module.app.app_context():
+        for project in module.Project.query:
+            module.db.session.delete(project)
+        module.db.session.commit()
+
+
+def page_ids(module, after=None):
+    with module.app.app_context():
+        page, cursor = module.paginate_projects(after)
+        return [project.id for project in page], cursor
+
+
+def test_cursor_walks_every_project_once(module, catalogue):
+    first, cursor = page_ids(module)
+    second, last = page_ids(module, cursor)
+    assert len(first) == module.PROJECTS_PER_PAGE
+    assert last is None
+    with module.app.app_context():
+        assert sorted(first + second) == sorted(project.id for project in module.Project.query)
+
+
+@pytest.mark.parametrize("after", [
+    "pas-un-curseur",
+    "2024-13-45T00:00:00_3",
+    "2024-01-01T00:00:00_abc",
+    "9999-12-31T00:00:00_999999999999999999999",
+    "2024-01-01T00:00:00_0",
+    "2024-01-01T00:00:00_-5",
+])
+def test_invalid_cursor_returns_first_page(module, client, catalogue, after):
+    assert page_ids(module, after) == page_ids(module)
+    assert client.get("/projects", query_string={"after": after}).status_code == 200
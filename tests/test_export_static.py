@@ -0,0 +1,87 @@
+"""export-static : chaque page du catalogue est exportée et reliée par un chemin servable sans query string."""
+
+import re
+import shutil
+from datetime import datetime, timedelta
+
+import pytest
+
+NEXT_LINK = re.compile(r'href="([^"]+)"[^>]*>Projets suivants')
+
+
+@pytest.fixture
+def catalogue(module):
+    with module.app.app_context():
+        for project in module.Project.query:
+            module.db.session.delete(project)
+        # Dates en partie identiques : le curseur départage par id
+        module.db.session.add_all(
+            module.Project(
+                name=f"Projet {i}", description="d", github_url="https://github.com/x", stack="Flask",
+                created_at=datetime(2024, 1, 1) + timedelta(days=i % 5),
+            )
+            for i in range(2 * module.PROJECTS_PER_PAGE + 3)
+        )
+        module.db.session.commit()
+        ids = {str(project.id) for project in module.Project.query}
+    yield ids
+    with module.app.app_context():
+        for project in module.Project.query:
+            module.db.session.delete(project)
+        module.db.session.commit()
+
+
+def test_export_follows_every_catalogue_page(module, catalogue, tmp_path):
+    written = module.export_static_site(tmp_path)
+    assert {"/projects", "/projects/page/2", "/projects/page/3"} <= set(written)
+
+    seen, path = [], "/projects/"
+    while path:
+        html = (tmp_path / path.strip("/") / "index.html").read_text()
+        assert 'name="q"' not in html
+        seen += re.findall(r'href="/project/(\d+)"', html)
+        link = NEXT_LINK.search(html)
+        path = link and link.group(1)
+        assert not path or "?" not in path
+    assert sorted(seen) == sorted(catalogue)
+
+
+def test_live_catalogue_keeps_cursor_links(client, catalogue):
+    html = client.get("/projects").get_data(as_text=True)
+    assert 'name="q"' in html
+    assert "/projects?after=" in NEXT_LINK.search(html).group(1)
+
+
+@pytest.fixture
+def live_assets(module, tmp_path, monkeypatch):
+    """static/ copié dans un répertoire temporaire et construit comme en production."""
+    static_dir = tmp_path / "site" / "static"
+    shutil.copytree(module.app.static_folder, static_dir, ignore=shutil.ignore_patterns(module.ASSET_DIST))
+    served = module.app.static_folder
+    monkeypatch.setattr(module.app, "static_folder", str(static_dir))
+    module.build_assets()
+    yield static_dir / module.ASSET_DIST
+    module.app.static_folder = served
+    module.load_asset_manifest()
+    module.PAGE_CACHE.clear()
+    module.FRAGMENT_CACHE.clear()
+
+
+def test_export_leaves_served_assets_untouched(module, live_assets, tmp_path):
+    manifest_file = (live_assets / "manifest.json").read_text()
+    served = dict(module.ASSET_MANIFEST)
+    files = sorted(p.relative_to(live_assets) for p in live_assets.rglob("*"))
+    (live_assets / "marker").write_text("worker")
+
+    output = tmp_path / "build"
+    module.export_static_site(output)
+
+    assert (live_assets / "manifest.json").read_text() == manifest_file
+    assert (live_assets / "marker").exists()
+    assert sorted(p.relative_to(live_assets) for p in live_assets.rglob("*") if p.name != "marker") == files
+    assert module.ASSET_MANIFEST == served
+    # Les pages exportées pointent vers des assets présents dans l'export
+    urls = set(re.findall(r'"/static/(dist/[^"]+)"', (output / "index.html").read_text()))
+    assert urls
+    for url in urls:
+        assert (output / "static" / url).is_file(), url
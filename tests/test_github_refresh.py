@@ -0,0 +1,49 @@
+"""La latence des pages ne dépend pas de l'API GitHub, même quand le snapshot est absent ou périmé."""
+
+import time
+from datetime import datetime, timedelta
+
+from conftest import wait_for_github_refresh
+
+GITHUB_DELAY = 1.0
+FAST = 0.5
+
+
+def timed_get(client, path):
+    start = time.perf_counter()
+    response = client.get(path)
+    return response, time.perf_counter() - start
+
+
+def test_cold_snapshot_served_from_fallback_then_synced(module, client, stub):
+    stub.delay = GITHUB_DELAY
+    response, elapsed = timed_get(client, "/")
+    assert response.status_code == 200
+    assert elapsed < FAST
+    assert module.GITHUB_REFRESH_STATE["running"]
+
+    wait_for_github_refresh(module)
+    assert [repo["name"] for repo in module.GITHUB_CACHE["repos"]]
+    assert all(repo["name"].startswith("repo-") for repo in module.GITHUB_CACHE["repos"])
+
+
+def test_expired_snapshot_refreshed_once_in_background(module, client, stub):
+    with module.app.app_context():
+        module.sync_github(force=True)
+        module.GitHubProfile.query.update(
+            {module.GitHubProfile.synced_at: datetime.utcnow() - timedelta(hours=4)}
+        )
+        module.db.session.commit()
+    module.GITHUB_SNAPSHOT["checked"] = float("-inf")
+    stub.delay = GITHUB_DELAY
+    stub.hits.clear()
+
+    for path in ("/", "/about", "/projects", "/"):
+        module.PAGE_CACHE.clear()
+        response, elapsed = timed_get(client, path)
+        assert response.status_code == 200
+        assert elapsed < FAST, path
+
+    wait_for_github_refresh(module)
+    profile_calls = [path for path, _ in stub.hits if path == f"/users/{stub.login}"]
+    assert profile_calls == [f"/users/{stub.login}"]
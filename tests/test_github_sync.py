@@ -0,0 +1,73 @@
+"""sync_github() : première sync (200), sync sans changement (304), push sur un dépôt, dépôt supprimé."""
+
+import pytest
+
+
+def run_sync(module, stub):
+    stub.hits.clear()
+    with module.app.app_context():
+        changed = module.sync_github(force=True)
+    return changed, list(stub.hits)
+
+
+def languages_calls(hits):
+    return [path for path, _ in hits if path.endswith("/languages")]
+
+
+@pytest.fixture
+def synced(module, stub):
+    changed, hits = run_sync(module, stub)
+    return changed, hits
+
+
+def test_first_sync_fetches_everything(module, stub, synced):
+    changed, hits = synced
+    assert changed
+    assert all(etag is None for _, etag in hits)
+    assert len(languages_calls(hits)) == len(stub.repos)
+    with module.app.app_context():
+        assert module.GitHubRepo.query.count() == len(stub.repos)
+        repo = module.db.session.query(module.GitHubRepo).filter_by(name="repo-0000").one()
+        assert [entry.language for entry in repo.languages] == ["Python"]
+        assert {entry.topic for entry in repo.topics} == set(stub.repos[0]["topics"])
+    assert module.GITHUB_CACHE["profile"]["name"] == stub.profile["name"]
+    assert len(module.GITHUB_CACHE["repos"]) == len(stub.repos)
+
+
+def test_unchanged_sync_only_revalidates(module, stub, synced):
+    changed, hits = run_sync(module, stub)
+    assert changed == 0
+    assert hits and all(etag for _, etag in hits)
+    assert languages_calls(hits) == []
+    with module.app.app_context():
+        assert module.GitHubRepo.query.count() == len(stub.repos)
+
+
+def test_push_refetches_only_that_repo(module, stub, synced):
+    pushed = stub.push(3)
+    changed, hits = run_sync(module, stub)
+    assert changed == 1
+    assert languages_calls(hits) == [f"/repos/{stub.login}/{pushed['name']}/languages"]
+    with module.app.app_context():
+        repo = module.db.session.query(module.GitHubRepo).filter_by(name=pushed["name"]).one()
+        assert repo.pushed_at == pushed["pushed_at"]
+        assert repo.stargazers_count == pushed["stargazers_count"]
+    cached = next(repo for repo in module.GITHUB_CACHE["repos"] if repo["name"] == pushed["name"])
+    assert cached["stargazers_count"] == pushed["stargazers_count"]
+
+
+def test_deleted_repo_is_removed(module, stub, synced):
+    removed = stub.repos.pop(5)
+    changed, hits = run_sync(module, stub)
+    assert changed == 1
+    assert languages_calls(hits) == []
+    with module.app.app_context():
+        assert module.db.session.query(module.GitHubRepo).filter_by(name=removed["name"]).first() is None
+        assert module.GitHubRepo.query.count() == len(stub.repos)
+        orphans = (
+            module.GitHubRepoTopic.query
+            .filter(~module.GitHubRepoTopic.repo_id.in_(module.db.session.query(module.GitHubRepo.id)))
+            .count()
+        )
+        assert orphans == 0
+    assert removed["name"] not in {repo["name"] for repo in module.GITHUB_CACHE["repos"]}
@@ -0,0 +1,21 @@
+"""/metrics protégé par METRICS_TOKEN ; en-tête Server-Timing en ASCII."""
+
+
+def test_metrics_disabled_without_token(client, monkeypatch, module):
+    monkeypatch.setitem(module.app.config, "METRICS_TOKEN", None)
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_requires_bearer_token(client, monkeypatch, module):
+    monkeypatch.setitem(module.app.config, "METRICS_TOKEN", "s3cret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer autre"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert b"# TYPE" in response.data
+
+
+def test_server_timing_is_ascii(client):
+    header = client.get("/services").headers["Server-Timing"]
+    header.encode("ascii")
+    assert 'desc="' in header
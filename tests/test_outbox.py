@@ -0,0 +1,27 @@
+"""POST /contact ne dépend pas de la latence SMTP ; process_outbox() envoie la file sur une seule connexion."""
+
+import time
+
+FAST = 0.3
+
+
+def test_contact_post_does_not_wait_for_smtp(module, client, smtp):
+    for i in range(3):
+        start = time.perf_counter()
+        response = client.post(
+            "/contact",
+            data={"name": f"Client {i}", "email": f"client{i}@example.com", "message": "Bonjour"},
+        )
+        assert response.status_code == 302
+        assert time.perf_counter() - start < FAST
+
+    with module.app.app_context():
+        assert module.Contact.query.count() == 3
+        assert module.OutboxMessage.query.filter(module.OutboxMessage.sent_at.is_(None)).count() == 3
+    assert smtp.messages == []
+
+    with module.app.app_context():
+        assert module.process_outbox() == 3
+        assert module.OutboxMessage.query.filter(module.OutboxMessage.sent_at.is_(None)).count() == 0
+    assert len(smtp.messages) == 3
+    assert len(smtp.peers) == 1
@@ -0,0 +1,59 @@
+"""Clé de PAGE_CACHE (URL publique, paramètres lus par la vue) et pré-rendu des pages par warm_up()."""
+
+import logging
+
+import pytest
+
+from conftest import wait_for_github_refresh
+
+
+@pytest.fixture
+def warmup(module, monkeypatch):
+    monkeypatch.setattr(module, "WARMUP_STATE", {"ready": False, "running": False, "error": None, "duration_ms": None})
+    monkeypatch.setitem(module.app.config, "TESTING", False)
+    # Pas de sync GitHub en arrière-plan : elle viderait PAGE_CACHE pendant le test
+    monkeypatch.setattr(module, "GITHUB_SYNC_INTERVAL", 0)
+    wait_for_github_refresh(module)
+    return module
+
+
+def cached_urls(module):
+    return set(module.PAGE_CACHE._entries)
+
+
+def test_warm_up_uses_configured_base_url(warmup, monkeypatch):
+    monkeypatch.setitem(warmup.app.config, "WARMUP_BASE_URL", "https://cognito.example/")
+    assert warmup.warm_up()
+    assert "https://cognito.example/" in cached_urls(warmup)
+    assert "https://cognito.example/about" in cached_urls(warmup)
+
+
+def test_warm_up_base_url_from_server_name(warmup, monkeypatch):
+    monkeypatch.setitem(warmup.app.config, "WARMUP_BASE_URL", None)
+    monkeypatch.setitem(warmup.app.config, "SERVER_NAME", "cognito.example")
+    monkeypatch.setitem(warmup.app.config, "PREFERRED_URL_SCHEME", "https")
+    assert warmup.warmup_base_url() == "https://cognito.example/"
+
+
+def test_warm_up_warns_on_default_host(warmup, monkeypatch, caplog):
+    monkeypatch.setitem(warmup.app.config, "WARMUP_BASE_URL", None)
+    monkeypatch.setitem(warmup.app.config, "SERVER_NAME", None)
+    with caplog.at_level(logging.WARNING, logger=warmup.app.logger.name):
+        assert warmup.warmup_base_url() == "http://localhost/"
+    assert "WARMUP_BASE_URL" in caplog.text
+
+
+def test_unread_query_args_share_the_cached_page(module, client, monkeypatch):
+    monkeypatch.setattr(module, "GITHUB_SYNC_INTERVAL", 0)
+    wait_for_github_refresh(module)
+    module.PAGE_CACHE.clear()
+    for i in range(5):
+        assert client.get(f"/about?x={i}").status_code == 200
+    assert client.get("/about").status_code == 200
+    assert cached_urls(module) == {"http://localhost/about"}
+
+
+def test_page_cache_key_keeps_declared_args(module):
+    with module.app.test_request_context("/projects?b=2&utm=x&a=1&a=0"):
+        assert module.page_cache_key(("a", "b")) == "http://localhost/projects?a=1&a=0&b=2"
+        assert module.page_cache_key() == "http://localhost/projects"